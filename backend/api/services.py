@@ -1,22 +1,28 @@
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import Integer, case, cast, extract
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
-from sqlmodel import Session, col, func, or_, select
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlmodel import Session, bindparam, col, delete, func, insert, literal, or_, select, tuple_, update
 
 from core.app_logging import logger
+from core.caching import DASHBOARD_NAMESPACE, cache
 from core.rate_limiting import limiter
 from db.database import get_session
 from dependancies.admin_auth import admin_required
+from dependancies.dependancies import utc_now
 from models.models import (
     AdminDashboardStats,
+    CooperativeStats,
     CreateLoan,
     CreatePayments,
     LoanUpdate,
     LoanDelete,
     Loan,
+    LoanWithPayments,
     Member,
     MemberCreate,
     MemberDetailed,
@@ -32,71 +38,401 @@ from models.models import (
     MemberSaving,
     SavingsRead,
     SavingsUpdate,
-    SavingsDelete
+    SavingsDelete,
+    LATE_FEE_RATE_DENOMINATOR,
+    LATE_FEE_RATE_NUMERATOR,
+    CENT,
+    ZERO_AMOUNT,
+    calculate_interest_due_cents,
+    calculate_late_fee_cents,
+    calculate_next_due_date,
+    from_cents,
+    split_payment_cents,
+    to_cents,
 )
 from models.users import User
 
-member_router = APIRouter(prefix="/member")
-loan_router = APIRouter(prefix="/loan")
-payment_router = APIRouter(prefix="/payment")
-admin_router = APIRouter(prefix="/admin", tags=["Admin Dashboard"])
-savings_router = APIRouter(prefix="/savings")
+# Every route below is admin-only. Handlers that also declare
+# `admin: User = Depends(admin_required)` (to log who acted) get the same
+# cached result, so the check still runs once per request.
+ADMIN_ONLY = [Depends(admin_required)]
+
+member_router = APIRouter(prefix="/member", dependencies=ADMIN_ONLY)
+loan_router = APIRouter(prefix="/loan", dependencies=ADMIN_ONLY)
+payment_router = APIRouter(prefix="/payment", dependencies=ADMIN_ONLY)
+admin_router = APIRouter(prefix="/admin", tags=["Admin Dashboard"], dependencies=ADMIN_ONLY)
+savings_router = APIRouter(prefix="/savings", dependencies=ADMIN_ONLY)
+
+DASHBOARD_CACHE_SECONDS = 60
+
+# A member may borrow up to twice their savings
+MAX_LOAN_TO_SAVINGS_RATIO = Decimal("2.00")
+
+# SQL counterpart of Payments.total_amount, for aggregating cash paid in the database
+PAYMENT_TOTAL_AMOUNT = (
+    Payments.principal_amount + Payments.interest_amount + Payments.late_fee_amount
+)
+
+# ==========================================
+# HOT STATEMENTS
+# ==========================================
+# Built once at import and executed with bind parameters, so hot requests skip
+# rebuilding the statement (and its cache key) on every call.
+MEMBER_EXISTS_STATEMENT = (
+    select(literal(1)).where(Member.id == bindparam("member_id")).limit(1)
+)
+
+# Same expression as the trigram index created by migration 1f6b8d0c3a52 on
+# PostgreSQL, so ILIKE searches there are answered from the index.
+MEMBER_SEARCH_TEXT = (
+    Member.first_name + " " + Member.last_name + " " + Member.phone_number
+)
+
+# Members whose first name, last name or phone number starts with the query
+# rank ahead of those that merely contain it
+MEMBER_SEARCH_RANK = case(
+    (
+        or_(
+            col(Member.first_name).ilike(bindparam("prefix"), escape="\\"),
+            col(Member.last_name).ilike(bindparam("prefix"), escape="\\"),
+            col(Member.phone_number).like(bindparam("prefix"), escape="\\"),
+        ),
+        0,
+    ),
+    else_=1,
+)
+
+# Only the MemberPublic / SavingsRead columns: rows are turned straight into
+# response models with model_construct, skipping ORM hydration and validation
+MEMBER_PUBLIC_COLUMNS = (
+    Member.id,
+    Member.first_name,
+    Member.last_name,
+    Member.date_of_birth,
+    Member.gender,
+    Member.phone_number,
+    Member.created_at,
+    Member.updated_at,
+)
+SAVINGS_READ_COLUMNS = (Savings.id, Savings.amount, Savings.created_at, Savings.updated_at)
+
+MEMBER_SEARCH_STATEMENT = (
+    select(*MEMBER_PUBLIC_COLUMNS)
+    .where(MEMBER_SEARCH_TEXT.ilike(bindparam("pattern"), escape="\\"))
+    .order_by(MEMBER_SEARCH_RANK, Member.last_name, Member.first_name, Member.id)
+    .limit(10)
+)
+
+MEMBER_LOANS_BY_STATUS_STATEMENT = (
+    select(Loan)
+    .where(Loan.member_id == bindparam("member_id"), Loan.status == bindparam("loan_status"))
+    .options(selectinload(Loan.payments), raiseload("*"))  # type: ignore
+)
+
+# One row per existing member (none for a missing one) holding the savings total
+MEMBER_SAVINGS_TOTAL_STATEMENT = select(Member.total_savings_cache).where(
+    Member.id == bindparam("member_id")
+)
+
+# The member together with its savings total. The total is selected as a column
+# so it is read fresh even when the Member is already in the session.
+MEMBER_WITH_SAVINGS_TOTAL_STATEMENT = select(Member, Member.total_savings_cache).where(
+    Member.id == bindparam("member_id")
+)
+
+MEMBER_HAS_OPEN_LOAN_STATEMENT = (
+    select(literal(1))
+    .where(Loan.member_id == bindparam("member_id"), Loan.status != "paid")
+    .limit(1)
+)
+
+# How many payments a loan has and how much principal they covered
+LOAN_PAYMENT_SUMMARY_STATEMENT = select(
+    func.count(Payments.id),  # type: ignore
+    func.coalesce(func.sum(Payments.principal_amount), 0),
+    func.coalesce(func.sum(Payments.interest_amount), 0),
+).where(Payments.loan_id == bindparam("loan_id"))
+
+# Principal and total cash paid on a loan, for its response figures
+LOAN_PAID_TOTALS_STATEMENT = select(
+    func.coalesce(func.sum(Payments.principal_amount), 0),
+    func.coalesce(func.sum(PAYMENT_TOTAL_AMOUNT), 0),
+).where(Payments.loan_id == bindparam("loan_id"))
+
+# What a member's loans contributed to the dashboard totals
+MEMBER_LOAN_TOTALS_STATEMENT = select(
+    select(func.count(Loan.id)).where(Loan.member_id == bindparam("member_id")).scalar_subquery(),  # type: ignore
+    select(func.coalesce(func.sum(Loan.amount), 0))
+    .where(Loan.member_id == bindparam("member_id"))
+    .scalar_subquery(),
+    select(func.coalesce(func.sum(Payments.principal_amount), 0))
+    .join(Loan)
+    .where(Loan.member_id == bindparam("member_id"))
+    .scalar_subquery(),
+    select(func.coalesce(func.sum(Payments.interest_amount), 0))
+    .join(Loan)
+    .where(Loan.member_id == bindparam("member_id"))
+    .scalar_subquery(),
+)
+
+# A no-op write that claims an active loan's row for the rest of the transaction:
+# a row lock on PostgreSQL and the write lock on SQLite (where SELECT ... FOR UPDATE
+# is silently dropped). Concurrent payments on a loan are therefore applied one at
+# a time, and a loan that is already paid matches no row.
+LOAN_CLAIM_STATEMENT = (
+    update(Loan)
+    .where(Loan.id == bindparam("loan_id"), Loan.status == "active")
+    .values(status=Loan.status)
+)
+
+LOAN_BALANCE_STATEMENT = (
+    select(
+        Loan.amount,
+        Loan.monthly_payment,
+        Loan.approved_at,
+        func.coalesce(func.sum(Payments.principal_amount), 0),
+        func.coalesce(func.sum(PAYMENT_TOTAL_AMOUNT), 0),
+    )
+    .outerjoin(Payments)
+    .where(Loan.id == bindparam("loan_id"))
+    .group_by(Loan.id)  # type: ignore
+)
+
+MARK_LOAN_PAID_STATEMENT = (
+    update(Loan)
+    .where(
+        Loan.id == bindparam("loan_id"),
+        Loan.status == "active",
+        select(func.coalesce(func.sum(Payments.principal_amount), 0))
+        .where(Payments.loan_id == Loan.id)
+        .scalar_subquery()
+        >= Loan.amount,
+    )
+    .values(status="paid")
+)
+
+# ------------------------------------------
+# Projected late fees, computed entirely in SQL
+# ------------------------------------------
+# Same rules as calculate_next_due_date + calculate_late_fee_cents, written
+# with integer month/cents arithmetic that SQLite and PostgreSQL both run.
+# Dates become month indexes (year * 12 + month - 1) so "add k months" is a
+# plain addition; money becomes integer cents so installment counts and the
+# half-even rounding are exact. Each layer below adds one derived column.
+
+# 1. Per active loan: approval date parts, installment and cash paid, in cents
+_loan_progress = (
+    select(
+        cast(extract("year", Loan.approved_at), Integer).label("approved_year"),
+        cast(extract("month", Loan.approved_at), Integer).label("approved_month"),
+        cast(extract("day", Loan.approved_at), Integer).label("approved_day"),
+        cast(func.round(Loan.monthly_payment * 100), Integer).label("monthly_cents"),
+        cast(func.round(func.coalesce(func.sum(PAYMENT_TOTAL_AMOUNT), 0) * 100), Integer).label("paid_cents"),
+    )
+    .outerjoin(Payments)
+    .where(Loan.status == "active")
+    .group_by(Loan.id)  # type: ignore
+    .subquery()
+)
+
+# 2. Month index of the next due date: approval month + installments paid + 1
+_installments_paid = case(
+    (_loan_progress.c.monthly_cents > 0, _loan_progress.c.paid_cents // _loan_progress.c.monthly_cents),
+    else_=0,
+)
+_loan_due_month = select(
+    (_loan_progress.c.approved_year * 12 + _loan_progress.c.approved_month + _installments_paid).label("due_index"),
+    _loan_progress.c.approved_day,
+    _loan_progress.c.monthly_cents,
+).subquery()
+
+# 3. Day of the next due date, clamped to the length of that month (like add_months)
+_due_year = _loan_due_month.c.due_index // 12
+_due_month = _loan_due_month.c.due_index % 12 + 1
+_is_leap_year = ((_due_year % 4 == 0) & (_due_year % 100 != 0)) | (_due_year % 400 == 0)
+_days_in_due_month = case(
+    (_due_month.in_([4, 6, 9, 11]), 30),
+    (_due_month == 2, case((_is_leap_year, 29), else_=28)),
+    else_=31,
+)
+_loan_due_date = select(
+    _loan_due_month.c.due_index,
+    case(
+        (_loan_due_month.c.approved_day > _days_in_due_month, _days_in_due_month),
+        else_=_loan_due_month.c.approved_day,
+    ).label("due_day"),
+    _loan_due_month.c.monthly_cents,
+).subquery()
+
+# 4. Penalty of every overdue loan, scaled by LATE_FEE_RATE_DENOMINATOR so it stays
+#    an integer (monthly cents * rate numerator * months late)
+_today_index = bindparam("today_index", type_=Integer)
+_today_day = bindparam("today_day", type_=Integer)
+_months_late = (
+    _today_index
+    - _loan_due_date.c.due_index
+    + case((_today_day >= _loan_due_date.c.due_day, 1), else_=0)
+)
+_overdue_loans = (
+    select((_loan_due_date.c.monthly_cents * LATE_FEE_RATE_NUMERATOR * _months_late).label("penalty"))
+    .where(
+        (_today_index > _loan_due_date.c.due_index)
+        | ((_today_index == _loan_due_date.c.due_index) & (_today_day > _loan_due_date.c.due_day))
+    )
+    .subquery()
+)
+
+# 5. Round every penalty half-even to whole cents, then add them up
+_penalty_cents = _overdue_loans.c.penalty // LATE_FEE_RATE_DENOMINATOR
+_penalty_remainder = _overdue_loans.c.penalty % LATE_FEE_RATE_DENOMINATOR
+PROJECTED_LATE_FEE_CENTS_STATEMENT = select(
+    func.coalesce(
+        func.sum(
+            _penalty_cents
+            + case(
+                (_penalty_remainder * 2 > LATE_FEE_RATE_DENOMINATOR, 1),
+                ((_penalty_remainder * 2 == LATE_FEE_RATE_DENOMINATOR) & (_penalty_cents % 2 == 1), 1),
+                else_=0,
+            )
+        ),
+        0,
+    )
+)
+
+
+def _late_fee_params(today: date) -> dict[str, int]:
+    """Bind parameters of the projected late fee statements for the given day."""
+    return {"today_index": today.year * 12 + today.month - 1, "today_day": today.day}
+
+
+# Recomputes every dashboard total from the base tables, the fallback when the
+# cooperative_stats row is missing. Each table is aggregated in its own scalar subquery so
+# the totals come back as ONE row in ONE round-trip (no cartesian join).
+DASHBOARD_TOTALS_STATEMENT = select(
+    select(func.count(Member.id)).scalar_subquery(),  # type: ignore
+    select(func.coalesce(func.sum(Savings.amount), 0)).scalar_subquery(),
+    select(func.count(Loan.id)).scalar_subquery(),  # type: ignore
+    select(func.coalesce(func.sum(Loan.amount), 0)).scalar_subquery(),
+    select(func.coalesce(func.sum(Payments.principal_amount), 0)).scalar_subquery(),
+    select(func.coalesce(func.sum(Payments.interest_amount), 0)).scalar_subquery(),
+    PROJECTED_LATE_FEE_CENTS_STATEMENT.scalar_subquery(),
+)
+
+STATS_ROW_ID = 1
+
+# The running totals plus the late fees, which depend on today's date
+DASHBOARD_STATS_STATEMENT = select(
+    CooperativeStats.total_members,
+    CooperativeStats.total_savings,
+    CooperativeStats.total_loans_issued_count,
+    CooperativeStats.total_principal_loaned,
+    CooperativeStats.total_principal_collected,
+    CooperativeStats.total_interest_collected,
+    PROJECTED_LATE_FEE_CENTS_STATEMENT.scalar_subquery(),
+).where(CooperativeStats.id == STATS_ROW_ID)
+
+# The member total kept by every member insert and delete
+MEMBER_COUNT_STATEMENT = select(CooperativeStats.total_members).where(
+    CooperativeStats.id == STATS_ROW_ID
+)
+
+
+def _search_params(q: str) -> dict[str, str]:
+    """LIKE patterns for the search term, escaping any LIKE metacharacters it contains."""
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return {"pattern": f"%{escaped}%", "prefix": f"{escaped}%"}
+
+
+def _adjust_stats(session: Session, **deltas) -> None:
+    """
+    Adds `deltas` (column name -> amount) to the running dashboard totals,
+    inside the caller's transaction. The row is seeded by its migration and
+    never created here, so no write can slip in between an aggregate and an insert.
+    """
+    session.exec(
+        update(CooperativeStats)
+        .where(CooperativeStats.id == STATS_ROW_ID)
+        .values({
+            getattr(CooperativeStats, name): getattr(CooperativeStats, name) + delta
+            for name, delta in deltas.items()
+        })
+    )  # type: ignore
+
+
+def _adjust_member_savings(session: Session, member_id: int | None, delta: Decimal) -> None:
+    """Adds `delta` to the member's running savings total, inside the caller's transaction."""
+    session.exec(
+        update(Member)
+        .where(Member.id == member_id)
+        # A deposit is not an edit of the member, so keep updated_at as it is
+        .values(
+            total_savings_cache=Member.total_savings_cache + delta,
+            updated_at=Member.updated_at,
+        )
+    )  # type: ignore
+
+
+def _member_exists(session: Session, member_id: int) -> bool:
+    """Cheap SELECT 1 probe for routes that only need to 404 on a missing member."""
+    return session.exec(MEMBER_EXISTS_STATEMENT, params={"member_id": member_id}).first() is not None
 
 
 # ==========================================
 # MEMBER ROUTES
 # ==========================================
-@member_router.post("/", response_model=MemberPublic, status_code=201)
-@limiter.limit("5/minute")
+@member_router.post("/", response_model=MemberPublic, status_code=201, dependencies=[Depends(limiter.limit("5/minute", burst=10))])
 def register_member(
-    request: Request,
     member_data: MemberCreate,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required),
 ):
-    existing_member = session.exec(
-        select(Member).where(Member.phone_number == member_data.phone_number)
-    ).first()
-
-    if existing_member:
-        raise HTTPException(
-            status_code=400, detail="Member with this phone number already exists"
-        )
-
-    new_member = Member.model_validate(member_data)
+    # The UNIQUE index on phone_number is the duplicate check: one INSERT, no race
+    # (INSERT ... RETURNING hands back the row without a unit-of-work flush)
 
     try:
-        session.add(new_member)
+        new_member = session.exec(
+            insert(Member).values(**member_data.model_dump()).returning(Member)  # type: ignore
+        ).scalar_one()
+        _adjust_stats(session, total_members=1)
         session.commit()
-        session.refresh(new_member)
-        logger.info(f"Admin {admin.email} registered new member: {new_member.id}")
+        cache.invalidate(DASHBOARD_NAMESPACE)
+        logger.info("Admin %s registered new member: %s", admin.email, new_member.id)
         return new_member
     except IntegrityError:
         session.rollback()
         raise HTTPException(
-            status_code=400, detail="Data integrity error (possible duplicate)"
+            status_code=400, detail="Member with this phone number already exists"
         )
     except Exception as e:
         session.rollback()
-        logger.error(f"Failed to register member: {str(e)}")
+        logger.error("Failed to register member: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@member_router.get("/", response_model=Dict[str, Any])
-@limiter.limit("20/minute")
+@member_router.get("/", response_model=Dict[str, Any], dependencies=[Depends(limiter.limit("20/minute"))])
 def get_all_members(
-    request: Request,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required),
     offset: int = 0,
-    limit: int = 20
+    limit: int = 20,
+    after_ts: datetime | None = Query(default=None, description="created_at of the last member on the previous page"),
+    after_id: int | None = Query(default=None, description="id of the last member on the previous page"),
+    with_count: bool = Query(default=False, description="Also return total_count"),
 ):
     """
-    Retrieves a paginated list of members. 
+    Retrieves a paginated list of members, newest first.
+    Page with `next_cursor` (after_ts/after_id) for O(limit) pages; `offset`
+    still works for jumping to a page. The total is only returned on request.
     Includes rate-limiting, input validation, and detailed logging.
     """
     # 1. Input Validation & Exception Handling
+    if (after_ts is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="after_ts and after_id must be provided together"
+        )
+
     if offset < 0:
-        logger.warning(f"Admin {admin.email} provided negative offset: {offset}")
+        logger.warning("Admin %s provided negative offset: %s", admin.email, offset)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, 
             detail="Offset cannot be negative."
@@ -104,114 +440,139 @@ def get_all_members(
     
     # Cap the limit to prevent huge memory spikes
     if limit > 100:
-        logger.warning(f"Admin {admin.email} requested excessive limit: {limit}. Capping to 100.")
+        logger.warning("Admin %s requested excessive limit: %s. Capping to 100.", admin.email, limit)
         limit = 100
     if limit <= 0:
         limit = 20
 
     try:
-        logger.info(f"FETCH_MEMBERS: Admin {admin.email} fetching batch (offset={offset}, limit={limit})")
-
-        # 2. Get total count (using func.count() is much faster than len(all_results))
-        total_statement = select(func.count()).select_from(Member)
-        total_count = session.exec(total_statement).one()
+        logger.info("FETCH_MEMBERS: Admin %s fetching batch (offset=%s, limit=%s)", admin.email, offset, limit)
+
+        # 2. Get total count only when asked, from the running stats row the
+        # dashboard reads (a full COUNT only if that row is missing)
+        total_count = None
+        if with_count:
+            total_count = session.exec(MEMBER_COUNT_STATEMENT).first()
+            if total_count is None:
+                total_count = session.exec(select(func.count()).select_from(Member)).one()
         
-        # 3. Fetch the specific slice
+        # 3. Fetch the specific slice (one extra row tells us if there is a next page)
         statement = (
-            select(Member)
-            .order_by(col(Member.created_at).desc())
-            .offset(offset)
-            .limit(limit)
+            select(*MEMBER_PUBLIC_COLUMNS)
+            .order_by(col(Member.created_at).desc(), col(Member.id).desc())
+            .limit(limit + 1)
         )
-        results = session.exec(statement).all()
+        if after_ts is not None:
+            statement = statement.where(
+                tuple_(Member.created_at, Member.id) < tuple_(after_ts, after_id)
+            )
+        else:
+            statement = statement.offset(offset)
+        results = [
+            MemberPublic.model_construct(**row._mapping)
+            for row in session.exec(statement)
+        ]
+
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            last = results[-1]
+            next_cursor = {"after_ts": last.created_at, "after_id": last.id}
 
-        logger.info(f"FETCH_SUCCESS: Successfully retrieved {len(results)} members for {admin.email}.")
+        logger.info("FETCH_SUCCESS: Successfully retrieved %s members for %s.", len(results), admin.email)
 
         return {
             "members": results,
             "total_count": total_count,
             "offset": offset,
-            "limit": limit
+            "limit": limit,
+            "next_cursor": next_cursor,
         }
 
     except Exception as e:
         # Catch-all for database connection errors or query failures
-        logger.error(f"DATABASE_ERROR: Error retrieving members for {admin.email}: {str(e)}")
+        logger.error("DATABASE_ERROR: Error retrieving members for %s: %s", admin.email, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An internal database error occurred while fetching members."
         )
 
-@member_router.get("/search", response_model=list[MemberPublic])
-@limiter.limit("10/minute")
-async def search_members(
-    request: Request,
+@member_router.get("/search", response_model=list[MemberPublic], dependencies=[Depends(limiter.limit("10/minute"))])
+def search_members(
     q: str = Query(..., min_length=2, description="Search by name or phone number"),
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required),
 ):
-    logger.info(f"Admin {admin.email} initiated search with query: '{q}'")
+    logger.info("Admin %s initiated search with query: '%s'", admin.email, q)
     try:
-        statement = (
-            select(Member)
-            .where(
-                or_(
-                    col(Member.first_name).ilike(f"%{q}%"),
-                    col(Member.last_name).ilike(f"%{q}%"),
-                    col(Member.phone_number).contains(q),
-                )
-            )
-            .limit(10)
-        )
-        results = session.exec(statement).all()
-        return results
+        params = _search_params(q)
+        # Database rows are already valid, so skip ORM hydration and re-validation
+        return [
+            MemberPublic.model_construct(**row._mapping)
+            for row in session.exec(MEMBER_SEARCH_STATEMENT, params=params)
+        ]
     except Exception as e:
-        logger.error(f"Database error during search for '{q}': {str(e)}")
+        logger.error("Database error during search for '%s': %s", q, e)
         raise HTTPException(status_code=500, detail="Error processing search.")
 
 
-@member_router.get("/{id}", response_model=MemberDetailed)
-@limiter.limit("20/minute")
+@member_router.get("/{id}", response_model=MemberDetailed, dependencies=[Depends(limiter.limit("20/minute"))])
 def get_member_detailed(
-    request: Request,
     id: int,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required),
 ):
-    logger.info(f"Admin {admin.email} requested details for Member ID: {id}")
+    logger.info("Admin %s requested details for Member ID: %s", admin.email, id)
 
-    statement = (
-        select(Member)
-        .where(Member.id == id)
-        .options(selectinload(Member.loans).selectinload(Loan.payments))  # type: ignore
-    )
-    member = session.exec(statement).first()
+    row = session.exec(
+        MEMBER_WITH_SAVINGS_TOTAL_STATEMENT, params={"member_id": id}
+    ).one_or_none()
 
-    if not member:
+    if not row:
         raise HTTPException(status_code=404, detail="Member not found")
+    member, total_savings = row
 
-    active = [loan for loan in member.loans if loan.status == "active"]
-    completed = [loan for loan in member.loans if loan.status == "paid"]
+    # Let the database partition the loans by status instead of scanning member.loans twice
+    def loans_with_status(loan_status: str):
+        params = {"member_id": id, "loan_status": loan_status}
+        return session.exec(MEMBER_LOANS_BY_STATUS_STATEMENT, params=params).all()
+
+    active = loans_with_status("active")
+    completed = loans_with_status("paid")
+
+    # Add each loan's payments up once, rather than once per computed property
+    today = utc_now().date()
+
+    def with_figures(loans):
+        return [
+            LoanWithPayments.model_validate(
+                loan, update=loan.balance_snapshot(*loan.paid_totals(), today)
+            )
+            for loan in loans
+        ]
 
     return MemberDetailed.model_validate(
-        member, update={"active_loans": active, "completed_loans": completed}
+        member,
+        update={
+            "active_loans": with_figures(active),
+            "completed_loans": with_figures(completed),
+            "total_savings": total_savings,
+        },
     )
     
-@member_router.patch("/update/{member_id}", response_model=MemberPublic, status_code=status.HTTP_200_OK)
-@limiter.limit("3/minute")
-async def update_member(
-    request: Request,
+@member_router.patch("/update/{member_id}", response_model=MemberPublic, status_code=status.HTTP_200_OK, dependencies=[Depends(limiter.limit("3/minute"))])
+def update_member(
     member_id: int,
     member_update_data: MemberUpdate,
     admin: User = Depends(admin_required),
     session: Session = Depends(get_session)
 ):
-    logger.info(f"Admin {admin.email} is attempting to update Member #{member_id}")
+    logger.info("Admin %s is attempting to update Member #%s", admin.email, member_id)
     
     # 1. Fetch the existing database object
     member_db = session.get(Member, member_id)
     if not member_db:
-        logger.warning(f"Update failed: Member #{member_id} not found.")
+        logger.warning("Update failed: Member #%s not found.", member_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Member not found"
@@ -222,7 +583,7 @@ async def update_member(
     
     # Check if they actually sent anything to update!
     if not update_dict:
-        logger.info(f"No new data provided for Member #{member_id}. Skipping update.")
+        logger.info("No new data provided for Member #%s. Skipping update.", member_id)
         return member_db
 
     # 3. Apply the dictionary values to the database object
@@ -232,38 +593,38 @@ async def update_member(
     try:
         session.add(member_db)
         session.commit()
-        session.refresh(member_db)
-        logger.info(f"Successfully updated Member #{member_id}. Fields changed: {list(update_dict.keys())}")
+        logger.info("Successfully updated Member #%s. Fields changed: %s", member_id, list(update_dict.keys()))
         return member_db
         
     except IntegrityError:
         session.rollback()
-        logger.error(f"Update failed for Member #{member_id}: Integrity Error (Likely a duplicate phone number)")
+        logger.error("Update failed for Member #%s: Integrity Error (Likely a duplicate phone number)", member_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Update failed. The provided data (e.g., phone number) may already be in use."
         )
     except Exception as e:
         session.rollback()
-        logger.error(f"Unexpected error while updating Member #{member_id}: {str(e)}")
+        logger.error("Unexpected error while updating Member #%s: %s", member_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during update."
         )
         
-@member_router.delete("/{member_id}", response_model=MemberDeleted, status_code=status.HTTP_200_OK)
-@limiter.limit("3/minute")
-async def delete_member(
-    request: Request,
+@member_router.delete("/{member_id}", response_model=MemberDeleted, status_code=status.HTTP_200_OK, dependencies=[Depends(limiter.limit("3/minute"))])
+def delete_member(
     member_id: int,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required)
 ):
-    logger.warning(f"Admin {admin.email} initiated deletion for Member #{member_id}")
+    logger.warning("Admin %s initiated deletion for Member #%s", admin.email, member_id)
 
-    db_member = session.get(Member, member_id)
+    # Only the names are needed for the response, not the whole member graph
+    db_member = session.exec(
+        select(Member.first_name, Member.last_name).where(Member.id == member_id)
+    ).first()
     if not db_member:
-        logger.error(f"Deletion failed: Member #{member_id} not found.")
+        logger.error("Deletion failed: Member #%s not found.", member_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Member not found"
@@ -274,27 +635,23 @@ async def delete_member(
     # ==========================================
     
     # 1. PRIORITY CHECK: Do they owe us money? (Active Loans)
-    has_active_loan = False
-    if hasattr(db_member, "loans"):
-        for loan in db_member.loans:
-            if getattr(loan, "status", "") != "paid":
-                has_active_loan = True
-                break
+    params = {"member_id": member_id}
+    has_active_loan = session.exec(MEMBER_HAS_OPEN_LOAN_STATEMENT, params=params).first() is not None
                 
     if has_active_loan:
-        logger.error(f"Deletion blocked: Member #{member_id} has an active loan.")
+        logger.error("Deletion blocked: Member #%s has an active loan.", member_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete member. They have an active loan that must be paid first."
         )
 
     # 2. SECONDARY CHECK: Do we owe them money? (Savings)
-    has_savings = getattr(db_member, "total_savings", 0) > 0
-    if not has_savings and hasattr(db_member, "savings"):
-        has_savings = sum(s.amount for s in db_member.savings) > 0
+    # The member was found above, so the statement always yields its row
+    total_savings = session.exec(MEMBER_SAVINGS_TOTAL_STATEMENT, params=params).one()
+    has_savings = total_savings > 0
         
     if has_savings:
-        logger.error(f"Deletion blocked: Member #{member_id} still has savings.")
+        logger.error("Deletion blocked: Member #%s still has savings.", member_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete member. They still have savings in the cooperative."
@@ -303,14 +660,42 @@ async def delete_member(
     # ==========================================
 
     try:
-        session.delete(db_member)
+        loans_count, loans_amount, principal_collected, interest_collected = session.exec(
+            MEMBER_LOAN_TOTALS_STATEMENT, params=params
+        ).one()
+        _adjust_stats(
+            session,
+            total_members=-1,
+            total_savings=-total_savings,
+            total_loans_issued_count=-loans_count,
+            total_principal_loaned=-loans_amount,
+            total_principal_collected=-principal_collected,
+            total_interest_collected=-interest_collected,
+        )
+
+        # Bulk deletes, children first, mirroring the ON DELETE CASCADE foreign keys
+        member_loan_ids = select(Loan.id).where(Loan.member_id == member_id)
+        session.exec(delete(Payments).where(col(Payments.loan_id).in_(member_loan_ids)))  # type: ignore
+        session.exec(delete(Loan).where(Loan.member_id == member_id))  # type: ignore
+        session.exec(delete(Savings).where(Savings.member_id == member_id))  # type: ignore
+        deleted = session.exec(delete(Member).where(Member.id == member_id))  # type: ignore
+        if not deleted.rowcount:
+            session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Member not found"
+            )
         session.commit()
-        logger.info(f"Successfully deleted Member #{member_id} ({db_member.first_name} {db_member.last_name}) and all associated records.")
-        return db_member
+        cache.invalidate(DASHBOARD_NAMESPACE)
+        logger.info("Successfully deleted Member #%s (%s %s) and all associated records.", member_id, db_member.first_name, db_member.last_name)
+        return MemberDeleted(first_name=db_member.first_name, last_name=db_member.last_name)
+
+    except HTTPException:
+        raise
         
     except Exception as e:
         session.rollback()
-        logger.error(f"Database error during deletion of Member #{member_id}: {str(e)}")
+        logger.error("Database error during deletion of Member #%s: %s", member_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during deletion."
@@ -319,41 +704,39 @@ async def delete_member(
 # ==========================================
 # SAVINGS ROUTES
 # ==========================================
-@savings_router.post("/{member_id}", response_model=SavingsRead, status_code=status.HTTP_201_CREATED)
-@limiter.limit("10/minute")
-async def record_savings(
-    request: Request,
+@savings_router.post("/{member_id}", response_model=SavingsRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(limiter.limit("10/minute", burst=20))])
+def record_savings(
     member_id: int,
     savings_data: MemberSaving,
     admin: User = Depends(admin_required),
     session: Session = Depends(get_session)
 ):
-    logger.info(f"Admin {admin.email} is recording a deposit for Member #{member_id}")
+    logger.info("Admin %s is recording a deposit for Member #%s", admin.email, member_id)
 
     # 1. Verify the member exists
-    db_member = session.get(Member, member_id)
-    if not db_member:
-        logger.warning(f"Deposit failed: Member #{member_id} not found.")
+    if not _member_exists(session, member_id):
+        logger.warning("Deposit failed: Member #%s not found.", member_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Member not found"
         )
         
-    # 2. Bind the deposit to the member
-    new_savings = Savings.model_validate(savings_data, update={"member_id": member_id})
-    
-    # 3. Save to database safely
+    # 2. Insert the deposit bound to the member, getting the row back in one statement
     try:
-        session.add(new_savings)
+        new_savings = session.exec(
+            insert(Savings).values(amount=savings_data.amount, member_id=member_id).returning(Savings)  # type: ignore
+        ).scalar_one()
+        _adjust_member_savings(session, member_id, new_savings.amount)
+        _adjust_stats(session, total_savings=new_savings.amount)
         session.commit()
-        session.refresh(new_savings)
+        cache.invalidate(DASHBOARD_NAMESPACE)
         
-        logger.info(f"Successfully recorded a {new_savings.amount} deposit for Member #{member_id}.")
+        logger.info("Successfully recorded a %s deposit for Member #%s.", new_savings.amount, member_id)
         return new_savings
         
     except IntegrityError:
         session.rollback()
-        logger.error(f"Integrity Error recording savings for Member #{member_id}")
+        logger.error("Integrity Error recording savings for Member #%s", member_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Database integrity error."
@@ -361,27 +744,31 @@ async def record_savings(
         
     except Exception as e:
         session.rollback()
-        logger.error(f"Unexpected error recording savings for Member #{member_id}: {str(e)}")
+        logger.error("Unexpected error recording savings for Member #%s: %s", member_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during deposit."
         )
 
-@savings_router.get("/{member_id}", response_model=list[SavingsRead])
-@limiter.limit("5/minute")
-async def get_members_savings(
-    request: Request,
+@savings_router.get("/{member_id}", response_model=list[SavingsRead], dependencies=[Depends(limiter.limit("5/minute"))])
+def get_members_savings(
     member_id: int,
-    skip: int = Query(default=0, ge=0, description="Number of records to skip"),
-    limit: int = Query(default=10, le=100, description="Max records to return (max 100)"),
+    after_ts: datetime | None = Query(default=None, description="updated_at of the last record on the previous page"),
+    after_id: int | None = Query(default=None, description="id of the last record on the previous page"),
+    limit: int = Query(default=10, ge=1, le=100, description="Max records to return (max 100)"),
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required)
 ):
-    logger.info(f"Admin {admin.email} requesting savings for Member #{member_id} (skip={skip}, limit={limit})")
+    logger.info("Admin %s requesting savings for Member #%s (after_ts=%s, after_id=%s, limit=%s)", admin.email, member_id, after_ts, after_id, limit)
 
-    db_member = session.get(Member, member_id)
-    if not db_member:
-        logger.warning(f"Fetch failed: Member #{member_id} not found.")
+    if (after_ts is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="after_ts and after_id must be provided together"
+        )
+
+    if not _member_exists(session, member_id):
+        logger.warning("Fetch failed: Member #%s not found.", member_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Member not found"
@@ -389,38 +776,43 @@ async def get_members_savings(
     
     try:
         statement = (
-            select(Savings)
+            select(*SAVINGS_READ_COLUMNS)
             .where(Savings.member_id == member_id)
-            .order_by(col(Savings.updated_at).desc())
-            .offset(skip)
+            .order_by(col(Savings.updated_at).desc(), col(Savings.id).desc())
             .limit(limit)
         )
-        member_savings = session.exec(statement).all()
+        if after_ts is not None:
+            # Keyset cursor: resume right after the last row of the previous page
+            statement = statement.where(
+                tuple_(Savings.updated_at, Savings.id) < tuple_(after_ts, after_id)
+            )
+        member_savings = [
+            SavingsRead.model_construct(**row._mapping)
+            for row in session.exec(statement)
+        ]
         
-        logger.info(f"Successfully retrieved {len(member_savings)} savings records for Member #{member_id}.")
+        logger.info("Successfully retrieved %s savings records for Member #%s.", len(member_savings), member_id)
         return member_savings
         
     except Exception as e:
-        logger.error(f"Database error while fetching savings for Member #{member_id}: {str(e)}")
+        logger.error("Database error while fetching savings for Member #%s: %s", member_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while retrieving savings."
         )
         
-@savings_router.patch("/{savings_id}", response_model=SavingsRead, status_code=status.HTTP_200_OK)
-@limiter.limit("5/minute")
-async def update_savings(
-    request: Request,
+@savings_router.patch("/{savings_id}", response_model=SavingsRead, status_code=status.HTTP_200_OK, dependencies=[Depends(limiter.limit("5/minute"))])
+def update_savings(
     savings_id: int,
     savings_update: SavingsUpdate,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required)
 ):
-    logger.info(f"Admin {admin.email} is attempting to update Savings record #{savings_id}")
+    logger.info("Admin %s is attempting to update Savings record #%s", admin.email, savings_id)
 
     db_savings = session.get(Savings, savings_id)
     if not db_savings:
-        logger.warning(f"Update failed: Savings record #{savings_id} not found.")
+        logger.warning("Update failed: Savings record #%s not found.", savings_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Savings record not found"
@@ -429,22 +821,33 @@ async def update_savings(
     update_data = savings_update.model_dump(exclude_unset=True)
     
     if not update_data:
-        logger.info(f"No new data provided for Savings record #{savings_id}. Skipping commit.")
+        logger.info("No new data provided for Savings record #%s. Skipping commit.", savings_id)
         return db_savings
 
+    if update_data.get("amount") is None:
+        logger.warning("Update failed: null amount for Savings record #%s.", savings_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Savings amount cannot be null."
+        )
+
     try:
+        previous_amount = db_savings.amount
         db_savings.sqlmodel_update(update_data)
         
         session.add(db_savings)
+        delta = Decimal(db_savings.amount) - previous_amount
+        _adjust_member_savings(session, db_savings.member_id, delta)
+        _adjust_stats(session, total_savings=delta)
         session.commit()
-        session.refresh(db_savings)
+        cache.invalidate(DASHBOARD_NAMESPACE)
         
-        logger.info(f"Successfully updated Savings record #{savings_id}. Fields changed: {list(update_data.keys())}")
+        logger.info("Successfully updated Savings record #%s. Fields changed: %s", savings_id, list(update_data.keys()))
         return db_savings
     
     except IntegrityError:
         session.rollback()
-        logger.error(f"Integrity Error while updating Savings record #{savings_id}")
+        logger.error("Integrity Error while updating Savings record #%s", savings_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Database integrity error. Verify the provided data."
@@ -452,25 +855,26 @@ async def update_savings(
     
     except Exception as e:
         session.rollback()
-        logger.error(f"Unexpected error updating Savings record #{savings_id}: {str(e)}")
+        logger.error("Unexpected error updating Savings record #%s: %s", savings_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during update."
         )
         
-@savings_router.delete("/{savings_id}", response_model=SavingsDelete, status_code=status.HTTP_200_OK)
-@limiter.limit("5/minute")
-async def delete_savings(
-    request: Request,
+@savings_router.delete("/{savings_id}", response_model=SavingsDelete, status_code=status.HTTP_200_OK, dependencies=[Depends(limiter.limit("5/minute"))])
+def delete_savings(
     savings_id: int,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required)
 ):
-    logger.warning(f"Admin {admin.email} initiated deletion for Savings record #{savings_id}")
+    logger.warning("Admin %s initiated deletion for Savings record #%s", admin.email, savings_id)
 
-    db_savings = session.get(Savings, savings_id)
+    # The member's name is part of the response, so fetch it in the same query
+    db_savings = session.exec(
+        select(Savings).where(Savings.id == savings_id).options(joinedload(Savings.member))  # type: ignore
+    ).first()
     if not db_savings:
-        logger.error(f"Deletion failed: Savings record #{savings_id} not found.")
+        logger.error("Deletion failed: Savings record #%s not found.", savings_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Savings record not found"
@@ -487,14 +891,17 @@ async def delete_savings(
 
     try:
         session.delete(db_savings)
+        _adjust_member_savings(session, db_savings.member_id, -amount_deleted)
+        _adjust_stats(session, total_savings=-amount_deleted)
         session.commit()
+        cache.invalidate(DASHBOARD_NAMESPACE)
         
-        logger.info(f"Successfully deleted {amount_deleted} RWF savings record #{savings_id} for {full_name}.")
+        logger.info("Successfully deleted %s RWF savings record #%s for %s.", amount_deleted, savings_id, full_name)
         return response_data
         
     except Exception as e:
         session.rollback()
-        logger.error(f"Database error during deletion of Savings record #{savings_id}: {str(e)}")
+        logger.error("Database error during deletion of Savings record #%s: %s", savings_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during deletion."
@@ -503,35 +910,34 @@ async def delete_savings(
 # ==========================================
 # LOAN ROUTES
 # ==========================================
-@loan_router.post("/{member_id}", response_model=PublicLoan, status_code=201)
-@limiter.limit("5/minute")
-async def register_loan(
-    request: Request,
+def _public_loan(session: Session, loan: Loan) -> PublicLoan:
+    """Builds a loan response from its summed payments instead of loading every payment row."""
+    totals = session.exec(LOAN_PAID_TOTALS_STATEMENT, params={"loan_id": loan.id}).one()
+    return PublicLoan.model_validate(
+        loan, update=loan.balance_snapshot(*totals, utc_now().date())
+    )
+
+
+@loan_router.post("/{member_id}", response_model=PublicLoan, status_code=201, dependencies=[Depends(limiter.limit("5/minute", burst=10))])
+def register_loan(
     member_id: int,
     loan_data: CreateLoan,
     session: Session = Depends(get_session),
-    admin: User = Depends(admin_required),
 ):
-    statement = (
-        select(Member).where(Member.id == member_id).options(selectinload(Member.loans))  # type: ignore
-    )
-    db_member = session.exec(statement).first()
+    # Only the savings total is needed, so fetch that scalar instead of hydrating a Member
+    total_savings = session.exec(
+        MEMBER_SAVINGS_TOTAL_STATEMENT, params={"member_id": member_id}
+    ).one_or_none()
 
-    if not db_member:
+    if total_savings is None:
         raise HTTPException(status_code=404, detail="Member not found")
 
-    active_loans = [l for l in db_member.loans if l.status == "active"]
-    if len(active_loans) >= 1:
-        raise HTTPException(
-            status_code=400, detail="Member already has an active debt."
-        )
-
-    if db_member.total_savings <= Decimal("0.00"):
+    if total_savings <= ZERO_AMOUNT:
         raise HTTPException(
             status_code=400, detail="Member has no savings account balance."
         )
 
-    max_loan_allowed = db_member.total_savings * Decimal("2.00")
+    max_loan_allowed = total_savings * MAX_LOAN_TO_SAVINGS_RATIO
     if loan_data.amount > max_loan_allowed:
         raise HTTPException(
             status_code=400,
@@ -549,29 +955,36 @@ async def register_loan(
 
     try:
         session.add(new_loan)
+        _adjust_stats(session, total_loans_issued_count=1, total_principal_loaned=new_loan.amount)
         session.commit()
-        session.refresh(new_loan)
-        logger.info(f"Loan ID {new_loan.id} approved for Member {member_id}")
-        return new_loan
+        cache.invalidate(DASHBOARD_NAMESPACE)
+        logger.info("Loan ID %s approved for Member %s", new_loan.id, member_id)
+        # A brand-new loan has no payments to load
+        figures = new_loan.balance_snapshot(ZERO_AMOUNT, ZERO_AMOUNT, utc_now().date())
+        return PublicLoan.model_validate(new_loan, update=figures)
+    except IntegrityError:
+        # The partial unique index allows only one 'active' loan per member
+        session.rollback()
+        raise HTTPException(
+            status_code=400, detail="Member already has an active debt."
+        )
     except Exception as e:
         session.rollback()
-        logger.error(f"Failed to issue loan: {str(e)}")
+        logger.error("Failed to issue loan: %s", e)
         raise HTTPException(status_code=500, detail="Error while processing loan")
     
-@loan_router.patch("/{loan_id}", response_model=PublicLoan, status_code=status.HTTP_200_OK)
-@limiter.limit("5/minute")
-async def update_loan(
-    request: Request,
+@loan_router.patch("/{loan_id}", response_model=PublicLoan, status_code=status.HTTP_200_OK, dependencies=[Depends(limiter.limit("5/minute"))])
+def update_loan(
     loan_id: int,
     update_loan_data: LoanUpdate,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required)
 ):
-    logger.info(f"Admin {admin.email} is attempting to update Loan #{loan_id}")
+    logger.info("Admin %s is attempting to update Loan #%s", admin.email, loan_id)
 
     db_loan = session.get(Loan, loan_id)
     if not db_loan:
-        logger.warning(f"Update failed: Loan #{loan_id} not found.")
+        logger.warning("Update failed: Loan #%s not found.", loan_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Loan not found"
@@ -580,21 +993,23 @@ async def update_loan(
     loan_data = update_loan_data.model_dump(exclude_unset=True)
     
     if not loan_data:
-        logger.info(f"No new data provided for Loan #{loan_id}. Skipping commit.")
-        return db_loan
+        logger.info("No new data provided for Loan #%s. Skipping commit.", loan_id)
+        return _public_loan(session, db_loan)
 
     try:
+        previous_amount = db_loan.amount
         db_loan.sqlmodel_update(loan_data)
         session.add(db_loan)
+        _adjust_stats(session, total_principal_loaned=db_loan.amount - previous_amount)
         session.commit()
-        session.refresh(db_loan)
+        cache.invalidate(DASHBOARD_NAMESPACE)
         
-        logger.info(f"Successfully updated Loan #{loan_id}. Fields changed: {list(loan_data.keys())}")
-        return db_loan
+        logger.info("Successfully updated Loan #%s. Fields changed: %s", loan_id, list(loan_data.keys()))
+        return _public_loan(session, db_loan)
         
     except IntegrityError:
         session.rollback()
-        logger.error(f"Integrity Error updating Loan #{loan_id}")
+        logger.error("Integrity Error updating Loan #%s", loan_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Database integrity error. Check if the provided data is valid."
@@ -602,25 +1017,26 @@ async def update_loan(
         
     except Exception as e:
         session.rollback()
-        logger.error(f"Unexpected error updating Loan #{loan_id}: {str(e)}")
+        logger.error("Unexpected error updating Loan #%s: %s", loan_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during loan update."
         )
         
-@loan_router.delete("/{loan_id}", response_model=LoanDelete, status_code=status.HTTP_200_OK)
-@limiter.limit("5/minute")
-async def delete_loan(
-    request: Request,
+@loan_router.delete("/{loan_id}", response_model=LoanDelete, status_code=status.HTTP_200_OK, dependencies=[Depends(limiter.limit("5/minute"))])
+def delete_loan(
     loan_id: int,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required)
 ):
-    logger.warning(f"Admin {admin.email} initiated deletion for Loan #{loan_id}")
+    logger.warning("Admin %s initiated deletion for Loan #%s", admin.email, loan_id)
 
-    db_loan = session.get(Loan, loan_id)
+    # The member's name is part of the response, so fetch it in the same query
+    db_loan = session.exec(
+        select(Loan).where(Loan.id == loan_id).options(joinedload(Loan.member))  # type: ignore
+    ).first()
     if not db_loan:
-        logger.error(f"Deletion failed: Loan #{loan_id} not found.")
+        logger.error("Deletion failed: Loan #%s not found.", loan_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Loan not found"
@@ -630,9 +1046,11 @@ async def delete_loan(
     last_name = db_loan.member.last_name if db_loan.member else "Member"
     full_name = f"{first_name} {last_name}"
     
-    payments_made = len(db_loan.payments) if db_loan.payments else 0
+    # Count and sum the payments in SQL instead of loading every one of them
+    params = {"loan_id": loan_id}
+    payments_made, principal_paid, interest_paid = session.exec(LOAN_PAYMENT_SUMMARY_STATEMENT, params=params).one()
     loan_amount = db_loan.amount
-    remaining_balance = db_loan.remaining_balance
+    remaining_balance = loan_amount - principal_paid
     
     loan_to_be_deleted = LoanDelete(
         member=full_name,
@@ -642,15 +1060,25 @@ async def delete_loan(
     )
     
     try:
-        session.delete(db_loan)
+        # Bulk deletes, so the ORM cascade does not load the payments either
+        session.exec(delete(Payments).where(Payments.loan_id == loan_id))  # type: ignore
+        session.exec(delete(Loan).where(Loan.id == loan_id))  # type: ignore
+        _adjust_stats(
+            session,
+            total_loans_issued_count=-1,
+            total_principal_loaned=-loan_amount,
+            total_principal_collected=-principal_paid,
+            total_interest_collected=-interest_paid,
+        )
         session.commit()
+        cache.invalidate(DASHBOARD_NAMESPACE)
         
-        logger.info(f"Successfully deleted Loan #{loan_id} ({loan_amount} RWF) for {full_name}.")
+        logger.info("Successfully deleted Loan #%s (%s RWF) for %s.", loan_id, loan_amount, full_name)
         return loan_to_be_deleted
         
     except Exception as e:
         session.rollback()
-        logger.error(f"Database error during deletion of Loan #{loan_id}: {str(e)}")
+        logger.error("Database error during deletion of Loan #%s: %s", loan_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during loan deletion."
@@ -659,174 +1087,204 @@ async def delete_loan(
 # ==========================================
 # PAYMENT ROUTES
 # ==========================================
-@payment_router.post("/{loan_id}", response_model=PublicPayments, status_code=201)
-@limiter.limit("10/minute")
+@payment_router.post("/{loan_id}", response_model=PublicPayments, status_code=201, dependencies=[Depends(limiter.limit("10/minute", burst=30))])
 def register_payment(
-    request: Request,
     loan_id: int,
     payment_data: CreatePayments,
     session: Session = Depends(get_session),
-    admin: User = Depends(admin_required),
 ):
-    statement = (
-        select(Loan).where(Loan.id == loan_id).options(selectinload(Loan.payments))  # type: ignore
-    )
-    db_loan = session.exec(statement).first()
-
-    if not db_loan:
-        raise HTTPException(status_code=404, detail="Loan not found")
+    params = {"loan_id": loan_id}
 
-    if db_loan.status == "paid":
+    # Claim the loan so concurrent payments on it are applied one at a time
+    claimed = session.exec(LOAN_CLAIM_STATEMENT, params=params)  # type: ignore
+    if not claimed.rowcount:
+        if not session.get(Loan, loan_id):
+            raise HTTPException(status_code=404, detail="Loan not found")
         raise HTTPException(status_code=400, detail="This loan is already fully paid.")
 
-    # Calculate required amounts
-    interest_due = db_loan.current_interest_due
-    total_clearance_amount = (
-        db_loan.remaining_balance + interest_due + db_loan.accumulated_late_fees
+    # One aggregated row instead of shipping the loan's whole payment history
+    loan_amount, monthly_payment, approved_at, principal_paid_so_far, total_cash_paid = session.exec(
+        LOAN_BALANCE_STATEMENT, params=params
+    ).one()
+
+    # Calculate required amounts (all money below is in integer cents)
+    remaining_balance = to_cents(loan_amount - principal_paid_so_far)
+    interest_due = calculate_interest_due_cents(remaining_balance)
+    late_fees_due = calculate_late_fee_cents(
+        calculate_next_due_date(approved_at, monthly_payment, total_cash_paid),
+        to_cents(monthly_payment),
+        utc_now().date(),
     )
+    total_clearance_amount = remaining_balance + interest_due + late_fees_due
 
-    if payment_data.amount > total_clearance_amount:
+    current_cash = to_cents(payment_data.amount)
+    if current_cash > total_clearance_amount:
         raise HTTPException(
             status_code=422,
-            detail=f"Overpayment! Total to clear the loan (including fees/interest) is {total_clearance_amount}.",
+            detail=f"Overpayment! Total to clear the loan (including fees/interest) is {from_cents(total_clearance_amount)}.",
         )
 
-    # --- THE WATERFALL PAYMENT LOGIC ---
-    current_cash = payment_data.amount
-
-    # 1. Pay off late fees first
-    late_fees_due = db_loan.accumulated_late_fees
-    late_fees_paid = min(current_cash, late_fees_due)
-    current_cash -= late_fees_paid
-
-    # 2. Pay off interest second
-    interest_due = db_loan.current_interest_due
-    interest_paid = min(current_cash, interest_due)
-    current_cash -= interest_paid
-
-    # 3. Whatever is left goes to the principal
-    principal_paid = current_cash
-
-    new_payment = Payments(
-        loan_id=loan_id, 
-        principal_amount=principal_paid, 
-        interest_amount=interest_paid,
-        late_fee_amount=late_fees_paid
+    # --- THE WATERFALL PAYMENT LOGIC: late fees, then interest, then principal ---
+    late_fees_paid, interest_paid, principal_paid = split_payment_cents(
+        current_cash, late_fees_due, interest_due
     )
-    session.add(new_payment)
 
-    # State Update: Check if principal hit zero
-    if (db_loan.remaining_balance - principal_paid) <= Decimal("0.00"):
-        db_loan.status = "paid"
-        logger.info(f"Loan {loan_id} has been fully paid off!")
-    
     try:
+        new_payment = session.exec(
+            insert(Payments)
+            .values(
+                loan_id=loan_id,
+                principal_amount=from_cents(principal_paid),
+                interest_amount=from_cents(interest_paid),
+                late_fee_amount=from_cents(late_fees_paid),
+            )
+            .returning(Payments)  # type: ignore
+        ).scalar_one()
+
+        # State Update: the database decides whether the principal hit zero,
+        # counting every payment on the loan including the one just inserted
+        paid_off = session.exec(MARK_LOAN_PAID_STATEMENT, params=params)  # type: ignore
+        if paid_off.rowcount:
+            logger.info("Loan %s has been fully paid off!", loan_id)
+
+        _adjust_stats(
+            session,
+            total_principal_collected=new_payment.principal_amount,
+            total_interest_collected=new_payment.interest_amount,
+        )
+
         session.commit()
-        session.refresh(new_payment)
+        cache.invalidate(DASHBOARD_NAMESPACE)
         logger.info(
-            f"Payment recorded: {principal_paid} to Principal, {interest_paid} to Interest."
+            "Payment recorded: %s to Principal, %s to Interest.",
+            new_payment.principal_amount,
+            new_payment.interest_amount,
         )
         return new_payment
 
     except Exception as e:
         session.rollback()
-        logger.error(f"Payment transaction failed: {str(e)}")
+        logger.error("Payment transaction failed: %s", e)
         raise HTTPException(
             status_code=500, detail="Internal server error during payment"
         )
         
-@payment_router.patch("/{payment_id}", response_model=PublicPayments, status_code=status.HTTP_200_OK)
-@limiter.limit("5/minute")
-async def update_payment(
-    request: Request,
+@payment_router.patch("/{payment_id}", response_model=PublicPayments, status_code=status.HTTP_200_OK, dependencies=[Depends(limiter.limit("5/minute"))])
+def update_payment(
     payment_id: int,
     payment_update: PaymentUpdate,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required)
 ):
-    logger.info(f"Admin {admin.email} is attempting to update amount for Payment #{payment_id}")
+    logger.info("Admin %s is attempting to update amount for Payment #%s", admin.email, payment_id)
+
+    # 1. Fetch Payment AND the associated Loan (just the loan row, not its payment history)
+    db_payment = session.get(
+        Payments,
+        payment_id,
+        options=[joinedload(Payments.loan), raiseload("*")],  # type: ignore
+    )
 
-    # 1. Fetch Payment AND the associated Loan
-    statement = select(Payments).where(Payments.id == payment_id).options(selectinload(Payments.loan))#type: ignore
-    db_payment = session.exec(statement).first()
-    
     if not db_payment or not db_payment.loan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Payment or associated loan not found")
 
     loan = db_payment.loan
 
-    # 2. Reconstruct the "Pre-Payment" mathematical state
+    # One aggregated row with what every payment on the loan covered so far
+    loan_amount, monthly_payment, approved_at, principal_paid_so_far, total_cash_paid = session.exec(
+        LOAN_BALANCE_STATEMENT, params={"loan_id": loan.id}
+    ).one()
+
+    # 2. Reconstruct the "Pre-Payment" mathematical state (all money below is in integer cents)
     # We find out what the loan looked like mathematically BEFORE this specific payment existed
-    pre_payment_principal = loan.remaining_balance + db_payment.principal_amount
-    pre_payment_interest = round(pre_payment_principal * Decimal("0.015"), 2)
-    pre_payment_late_fees = loan.accumulated_late_fees + db_payment.late_fee_amount
-    
+    pre_payment_principal = to_cents(loan_amount - principal_paid_so_far + db_payment.principal_amount)
+    pre_payment_interest = calculate_interest_due_cents(pre_payment_principal)
+    pre_payment_late_fees = to_cents(db_payment.late_fee_amount)
+    if loan.status != "paid":
+        pre_payment_late_fees += calculate_late_fee_cents(
+            calculate_next_due_date(approved_at, monthly_payment, total_cash_paid),
+            to_cents(monthly_payment),
+            utc_now().date(),
+        )
+
     total_clearance_needed = pre_payment_principal + pre_payment_interest + pre_payment_late_fees
 
     # 3. Check for Overpayment
     new_amount = payment_update.amount
-    if new_amount > total_clearance_needed: #type: ignore
+    if to_cents(new_amount) > total_clearance_needed: #type: ignore
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Overpayment! The max debt (including this payment) is {total_clearance_needed} RWF."
+            detail=f"Overpayment! The max debt (including this payment) is {from_cents(total_clearance_needed)} RWF."
         )
 
     # 4. Re-Run the Waterfall Logic with the NEW Amount
-    cash_remaining = new_amount
-
-    new_late_fee_part = min(cash_remaining, pre_payment_late_fees) #type: ignore
-    cash_remaining -= new_late_fee_part #type: ignore
-
-    new_interest_part = min(cash_remaining, pre_payment_interest)
-    cash_remaining -= new_interest_part
+    late_fee_cents, interest_cents, principal_cents = split_payment_cents(
+        to_cents(new_amount), pre_payment_late_fees, pre_payment_interest  #type: ignore
+    )
 
-    new_principal_part = cash_remaining
+    new_late_fee_part = from_cents(late_fee_cents)
+    new_interest_part = from_cents(interest_cents)
+    new_principal_part = from_cents(principal_cents)
+    paid_off = principal_cents >= pre_payment_principal
 
     try:
         # 5. Update the physical database columns for the payment
         # (We do NOT touch loan.remaining_balance or payment.total_amount because they are dynamic @properties!)
+        _adjust_stats(
+            session,
+            total_principal_collected=new_principal_part - db_payment.principal_amount,
+            total_interest_collected=new_interest_part - db_payment.interest_amount,
+        )
         db_payment.late_fee_amount = new_late_fee_part
         db_payment.interest_amount = new_interest_part
         db_payment.principal_amount = new_principal_part
         
-        # Save the payment first so the Loan properties can auto-calculate based on the new data
-        session.add(db_payment)
-        session.commit()
-        
-        # 6. Check if the loan is now paid off based on the newly auto-calculated remaining balance!
-        if loan.remaining_balance <= Decimal("0.00"):
+        # 6. Check if the loan is now paid off based on the recalculated remaining balance!
+        if paid_off:
             loan.status = "paid"
         else:
             loan.status = "active"
             
+        # Payment and loan status are saved together: a failed reopen keeps the old payment
+        session.add(db_payment)
         session.add(loan)
         session.commit()
-        session.refresh(db_payment)
+        cache.invalidate(DASHBOARD_NAMESPACE)
         
-        logger.info(f"Payment #{payment_id} recalculated: {new_amount} RWF -> Fees: {new_late_fee_part}, Int: {new_interest_part}, Prin: {new_principal_part}")
+        logger.info("Payment #%s recalculated: %s RWF -> Fees: %s, Int: %s, Prin: %s", payment_id, new_amount, new_late_fee_part, new_interest_part, new_principal_part)
         return db_payment
 
+    except IntegrityError:
+        session.rollback()
+        logger.error("Payment #%s update would reopen a loan while the member has another active loan.", payment_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot reopen this loan: the member already has another active loan."
+        )
+
     except Exception as e:
         session.rollback()
-        logger.error(f"Error recalculating Payment #{payment_id}: {str(e)}")
+        logger.error("Error recalculating Payment #%s: %s", payment_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during payment recalculation."
         )
         
-@payment_router.delete("/{payment_id}", response_model=PaymentDelete, status_code=status.HTTP_200_OK)
-@limiter.limit("5/minute")
-async def delete_payment(
-    request: Request,
+@payment_router.delete("/{payment_id}", response_model=PaymentDelete, status_code=status.HTTP_200_OK, dependencies=[Depends(limiter.limit("5/minute"))])
+def delete_payment(
     payment_id: int,
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required)
 ):
-    logger.warning(f"Admin {admin.email} initiated deletion for Payment #{payment_id}")
+    logger.warning("Admin %s initiated deletion for Payment #%s", admin.email, payment_id)
 
-    db_payment = session.get(Payments, payment_id)
+    db_payment = session.get(
+        Payments,
+        payment_id,
+        options=[joinedload(Payments.loan).joinedload(Loan.member)],  # type: ignore
+    )
     if not db_payment:
-        logger.error(f"Deletion failed: Payment #{payment_id} not found.")
+        logger.error("Deletion failed: Payment #%s not found.", payment_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Payment not found"
@@ -851,18 +1309,32 @@ async def delete_payment(
         if loan and loan.status == "paid":
             loan.status = "active"
             session.add(loan)
-            logger.info(f"Loan #{loan.id} status automatically reverted to 'active'.")
+            logger.info("Loan #%s status automatically reverted to 'active'.", loan.id)
 
         # 3. Delete the payment
         session.delete(db_payment)
+        _adjust_stats(
+            session,
+            total_principal_collected=-db_payment.principal_amount,
+            total_interest_collected=-db_payment.interest_amount,
+        )
         session.commit()
+        cache.invalidate(DASHBOARD_NAMESPACE)
         
-        logger.info(f"Successfully deleted {amount} RWF payment #{payment_id} for {first_name} {last_name}.")
+        logger.info("Successfully deleted %s RWF payment #%s for %s %s.", amount, payment_id, first_name, last_name)
         return deleted_payment
+
+    except IntegrityError:
+        session.rollback()
+        logger.error("Deleting Payment #%s would reopen a loan while the member has another active loan.", payment_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot reopen this loan: the member already has another active loan."
+        )
         
     except Exception as e:
         session.rollback()
-        logger.error(f"Database error during deletion of Payment #{payment_id}: {str(e)}")
+        logger.error("Database error during deletion of Payment #%s: %s", payment_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during payment deletion."
@@ -871,70 +1343,69 @@ async def delete_payment(
 #=======================================================
 #ADMIN ROUTES
 #======================================================
-@admin_router.get("/dashboard-stats", response_model=AdminDashboardStats, status_code=status.HTTP_200_OK)
-@limiter.limit("10/minute")
-async def get_dashboard_stats(
-    request: Request,
+@admin_router.get("/dashboard-stats", response_model=AdminDashboardStats, status_code=status.HTTP_200_OK, dependencies=[Depends(limiter.limit("10/minute"))])
+def get_dashboard_stats(
     session: Session = Depends(get_session),
     admin: User = Depends(admin_required),
 ):
-    logger.info(f"Admin {admin.email} generated the financial dashboard.")
+    logger.info("Admin %s generated the financial dashboard.", admin.email)
+
+    # Admins poll this page; serve repeat hits from the cache until it expires
+    # or a write endpoint invalidates it. The version is read before the totals,
+    # so a result computed from data a write has since changed is stored under a
+    # key nobody reads any more.
+    cache_version = cache.version(DASHBOARD_NAMESPACE)
+    cache_key = f"stats:{cache_version}"
+    if cache_version is not None:
+        cached_stats = cache.get(DASHBOARD_NAMESPACE, cache_key)
+        if cached_stats is not None:
+            return AdminDashboardStats.model_validate_json(cached_stats)
 
     try:
-        # 1. DATABASE AGGREGATION (Lightning fast SQL Level calculations)
-
-        # Members
-        total_members = session.exec(select(func.count(Member.id))).one() or 0 #type: ignore
-        
-        # THE FIX: Sum the actual 'amount' column from the Savings table
-        total_savings = session.exec(select(func.sum(Savings.amount))).one() or Decimal("0.00")
-
-        # Loans
-        total_loans_count = session.exec(select(func.count(Loan.id))).one() or 0 #type: ignore
-        total_principal_loaned = session.exec(
-            select(func.sum(Loan.amount))
-        ).one() or Decimal("0.00")
-
-        # Payments (Realized Profits & Principal Collected)
-        total_principal_collected = session.exec(
-            select(func.sum(Payments.principal_amount))
-        ).one() or Decimal("0.00")
-        
-        total_interest_collected = session.exec(
-            select(func.sum(Payments.interest_amount))
-        ).one() or Decimal("0.00")
-
-        # 2. PYTHON AGGREGATION (For dynamic @property calculations)
-
-        # Fetch active loans WITH their payments to calculate dynamic metrics accurately
-        active_loans_statement = (
-            select(Loan)
-            .where(Loan.status == "active")
-            .options(selectinload(Loan.payments))#type: ignore
-        )
-        active_loans = session.exec(active_loans_statement).all()
-
-        projected_late_fees = sum(
-            (loan.accumulated_late_fees for loan in active_loans), Decimal("0.00")
-        )
-
-        # Outstanding Principal is simply Loaned - Collected
+        # 1. RUNNING TOTALS (one row maintained by the write endpoints)
+        params = _late_fee_params(utc_now().date())
+        stats_row = session.exec(DASHBOARD_STATS_STATEMENT, params=params).first()
+        if stats_row is None:
+            # The row was lost: report from the base tables, but do not recreate it
+            # here (re-run the stats migration's seed to restore the running totals)
+            logger.error("Dashboard stats row is missing; aggregating from the base tables.")
+            stats_row = session.exec(DASHBOARD_TOTALS_STATEMENT, params=params).one()
+
+        (
+            total_members,
+            total_savings,
+            total_loans_count,
+            total_principal_loaned,
+            total_principal_collected,
+            total_interest_collected,
+            projected_late_fee_cents,  # integer cents, computed by the database
+        ) = stats_row
+
+        # 2. Outstanding Principal is simply Loaned - Collected
         outstanding_principal = total_principal_loaned - total_principal_collected
 
-        # 3. Construct and return the payload
-        return AdminDashboardStats(
+        # 3. Construct, cache and return the payload
+        dashboard_stats = AdminDashboardStats(
             total_members=total_members,
-            total_savings=round(total_savings, 2),
+            total_savings=total_savings.quantize(CENT),
             total_loans_issued_count=total_loans_count,
-            total_principal_loaned=round(total_principal_loaned, 2),
-            total_principal_collected=round(total_principal_collected, 2),
-            total_interest_collected=round(total_interest_collected, 2),
-            outstanding_principal=round(outstanding_principal, 2),
-            projected_late_fees=round(projected_late_fees, 2),
+            total_principal_loaned=total_principal_loaned.quantize(CENT),
+            total_principal_collected=total_principal_collected.quantize(CENT),
+            total_interest_collected=total_interest_collected.quantize(CENT),
+            outstanding_principal=outstanding_principal.quantize(CENT),
+            projected_late_fees=from_cents(projected_late_fee_cents),
         )
+        if cache_version is not None:
+            cache.set(
+                DASHBOARD_NAMESPACE,
+                cache_key,
+                dashboard_stats.model_dump_json(),
+                expire=DASHBOARD_CACHE_SECONDS,
+            )
+        return dashboard_stats
 
     except Exception as e:
-        logger.error(f"Failed to generate dashboard stats: {str(e)}")
+        logger.error("Failed to generate dashboard stats: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while generating dashboard statistics."
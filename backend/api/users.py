@@ -1,20 +1,26 @@
+import hashlib
+
 import jwt
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jwt.exceptions import InvalidTokenError
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
+from sqlmodel import Session, bindparam, select
 
 from core.app_logging import logger
+from core.caching import LOGIN_FAILURE_NAMESPACE, cache
 from core.rate_limiting import limiter
 from db.database import get_session
 from dependancies.auth import (
     ALGORITHM,
-    SECRET_KEY,
+    DUMMY_PASSWORD_HASH,
+    SIGNING_KEY,
     create_access_token,
     create_password_hash,
     create_refresh_token,
     current_user,
+    token_digest,
+    verify_and_update_password_hash,
     verify_password_hash,
 )
 from models.users import (
@@ -29,83 +35,126 @@ from models.users import (
 user_router = APIRouter(prefix="/auth")
 oauth2_scheme = OAuth2PasswordBearer("/login")
 
+# Built once and executed with a bind parameter on every login
+USER_BY_EMAIL_STATEMENT = select(User).where(User.email == bindparam("email"))
+
+# How long a wrong password is remembered, so retrying it skips the Argon2 hash
+FAILED_LOGIN_CACHE_SECONDS = 60
+# blake2b keys are limited to 64 bytes
+FAILED_LOGIN_DIGEST_KEY = SIGNING_KEY[:64]
+
+
+def _failed_login_key(username: str, password: str) -> str:
+    """
+    Keyed digest of a login attempt, built from what was submitted so unknown and
+    known emails are remembered alike. The secret key keeps the attempted
+    emails and passwords out of the cache.
+    """
+    digest = hashlib.blake2b(username.encode(), key=FAILED_LOGIN_DIGEST_KEY)
+    digest.update(b"\0")
+    digest.update(password.encode())
+    return digest.hexdigest()
+
+
+def _forget_failed_login(email: str, password: str) -> None:
+    """
+    Call whenever `password` becomes the account's password (registration or any
+    hash change): an earlier failed attempt with it must not reject the first login.
+    """
+    cache.delete(LOGIN_FAILURE_NAMESPACE, _failed_login_key(email, password))
+
 
-@user_router.get("/")
-@limiter.limit("5/minute")
-def home(request: Request):
+@user_router.get("/", dependencies=[Depends(limiter.limit("5/minute"))])
+async def home():
     return {"status": "active"}
 
 
 @user_router.post(
-    "/register", response_model=UserRead, status_code=status.HTTP_201_CREATED
+    "/register",
+    response_model=UserRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(limiter.limit("5/minute"))],
 )
-@limiter.limit("5/minutes")
-async def user_registration(
-    request: Request, user_data: UserCreate, session: Session = Depends(get_session)
+def user_registration(
+    user_data: UserCreate, session: Session = Depends(get_session)
 ):
-    existing_user = session.exec(
-        select(User).where(User.email == user_data.email)
-    ).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User with this email already exists",
-        )
+    # The UNIQUE index on email is the duplicate check: one INSERT, no race
     hash_password = create_password_hash(user_data.password)
     new_user = User.model_validate(user_data, update={"hashed_password": hash_password})
 
     try:
         session.add(new_user)
         session.commit()
-        logger.info(f"User registered successfully: {new_user.email}")
+        _forget_failed_login(user_data.email, user_data.password)
+        logger.info("User registered successfully: user ID %s", new_user.id)
         return new_user
 
     except IntegrityError:
         session.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Integrity error: possibly a duplicate email.",
+            detail="User with this email already exists",
         )
     except Exception as e:
         session.rollback()
-        logger.error(f"Registration failed: {str(e)}")
+        logger.error("Registration failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error",
         )
 
 
-@user_router.post("/login")
-@limiter.limit("3/minute")
-async def login(
-    request: Request,
+@user_router.post("/login", dependencies=[Depends(limiter.limit("3/minute"))])
+def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     session: Session = Depends(get_session),
 ):
-    logger.info(f"Login attempt initiated for user: {form_data.username}")
+    invalid_credentials = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
 
-    statement = select(User).where(User.email == form_data.username)
-    db_user = session.exec(statement).first()
+    # A retried failure is answered before the user lookup, so the fast path
+    # looks the same whether or not the email exists
+    failed_login_key = _failed_login_key(form_data.username, form_data.password)
+    if cache.get(LOGIN_FAILURE_NAMESPACE, failed_login_key):
+        logger.warning("Login failed: Repeated failed attempt")
+        raise invalid_credentials
 
-    if not db_user:
-        logger.warning(f"Login failed: User {form_data.username} not found")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    db_user = session.exec(
+        USER_BY_EMAIL_STATEMENT, params={"email": form_data.username}
+    ).first()
 
-    if not verify_password_hash(form_data.password, db_user.hashed_password):
-        logger.warning(
-            f"Login failed: Incorrect password for user {form_data.username}"
-        )
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+    if not db_user:
+        # Hash anyway, so an unknown email is not answered faster than a wrong password
+        verify_password_hash(form_data.password, DUMMY_PASSWORD_HASH)
+        logger.warning("Login failed: Unknown user")
+        verified, updated_hash = False, None
+    else:
+        verified, updated_hash = verify_and_update_password_hash(
+            form_data.password, db_user.hashed_password
         )
-
-    logger.info(f"Successful login for user ID: {db_user.id}")
+        if not verified:
+            logger.warning("Login failed: Incorrect password for user ID: %s", db_user.id)
+
+    if not db_user or not verified:
+        cache.set(LOGIN_FAILURE_NAMESPACE, failed_login_key, "1", expire=FAILED_LOGIN_CACHE_SECONDS)
+        raise invalid_credentials
+
+    if updated_hash:
+        # Stored with older Argon2 parameters: upgrade it now that we have the password
+        try:
+            db_user.hashed_password = updated_hash
+            session.add(db_user)
+            session.commit()
+            _forget_failed_login(db_user.email, form_data.password)
+            logger.info("Rehashed password for user ID: %s", db_user.id)
+        except Exception as e:
+            session.rollback()
+            logger.error("Password rehash failed for user ID %s: %s", db_user.id, e)
+
+    logger.info("Successful login for user ID: %s", db_user.id)
 
     access_token = create_access_token(db_user.id)  # type: ignore
     refresh_token = create_refresh_token(db_user.id)  # type: ignore
@@ -117,7 +166,7 @@ async def login(
     }
 
 @user_router.get("/me", response_model=UserRead)
-def get_me(user: User = Depends(current_user)):
+async def get_me(user: User = Depends(current_user)):
     """
     This is the route your frontend is calling!
     It uses the token to find the user and returns their info.
@@ -125,16 +174,24 @@ def get_me(user: User = Depends(current_user)):
     return user
 
 @user_router.post("/logout")
-async def logout(
+def logout(
     token_data: LogoutRequest,
     token: str = Depends(oauth2_scheme),
     session: Session = Depends(get_session),
 ):
-    access_block = TokenBlocklist(token=token, token_type="access")
-    refresh_block = TokenBlocklist(token=token_data.token, token_type="refresh")
+    access_block = TokenBlocklist(token_hash=token_digest(token), token_type="access")
+    refresh_block = TokenBlocklist(
+        token_hash=token_digest(token_data.token), token_type="refresh"
+    )
     try:
         session.add(access_block)
-        session.add(refresh_block)
+        session.flush()
+        try:
+            with session.begin_nested():
+                session.add(refresh_block)
+        except IntegrityError:
+            # The refresh token was already spent; the access token is still revoked
+            pass
         session.commit()
 
         logger.info("User logged out and tokens invalidated.")
@@ -146,12 +203,12 @@ async def logout(
 
     except Exception as e:
         session.rollback()
-        logger.error(f"Logout failed: {str(e)}")
+        logger.error("Logout failed: %s", e)
         raise HTTPException(status_code=500, detail="Could not log out")
 
 
 @user_router.post("/refresh", response_model=TokenResponse)
-async def refresh_access_token(
+def refresh_access_token(
     token_data: LogoutRequest, session: Session = Depends(get_session)
 ):
     auth_exception = HTTPException(
@@ -160,17 +217,8 @@ async def refresh_access_token(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    is_blocked = session.exec(
-        select(TokenBlocklist).where(TokenBlocklist.token == token_data.token)
-    ).first()
-    if is_blocked:
-        logger.warning(
-            f"Refresh attempt with blacklisted token: {token_data.token[:10]}..."
-        )
-        raise auth_exception
-
     try:
-        payload = jwt.decode(token_data.token, key=SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token_data.token, key=SIGNING_KEY, algorithms=[ALGORITHM])
         user_id = payload.get("sub")
         token_type = payload.get("type")
 
@@ -180,7 +228,11 @@ async def refresh_access_token(
     except InvalidTokenError:
         raise auth_exception
 
-    old_refresh_block = TokenBlocklist(token=token_data.token, token_type="refresh")
+    # Revoking the old token is also the reuse check: the blocklist's unique index
+    # rejects a token that was already spent, even by a concurrent refresh
+    old_refresh_block = TokenBlocklist(
+        token_hash=token_digest(token_data.token), token_type="refresh"
+    )
     session.add(old_refresh_block)
 
     new_access_token = create_access_token(int(user_id))
@@ -188,9 +240,15 @@ async def refresh_access_token(
 
     try:
         session.commit()
+    except IntegrityError:
+        session.rollback()
+        logger.warning(
+            "Refresh attempt with blacklisted token: %s...", token_data.token[:10]
+        )
+        raise auth_exception
     except Exception as e:
         session.rollback()
-        logger.error(f"Failed to rotate tokens: {e}")
+        logger.error("Failed to rotate tokens: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
     return {
@@ -198,9 +256,3 @@ async def refresh_access_token(
         "refresh_token": new_refresh_token,
         "token_type": "bearer",
     }
-
-
-@user_router.get("/me", response_model=UserRead)
-async def get_current_user(user: User = Depends(current_user)):
-    logger.info(f"User {user.email} accessed their profile.")
-    return user
@@ -1,7 +1,21 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
-logging.basicConfig(level=logging.INFO,
-                    handlers=[logging.StreamHandler(sys.stdout)],
-                    format="%(asctime)s - %(levelname)s - %(message)s")
+# Request threads only put records on a queue; a background thread does the
+# blocking writes to stdout, so a slow console never holds up a request.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_listener = logging.handlers.QueueListener(_log_queue, _stdout_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+# Only merges the arguments into the message; the stdout handler adds the rest
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger("ikimina app")
\ No newline at end of file
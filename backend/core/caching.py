@@ -0,0 +1,142 @@
+import os
+import threading
+import time
+from typing import Any
+
+from redis import Redis
+
+from core.app_logging import logger
+
+
+CACHE_URL = os.getenv("REDIS_URL", "memory://")
+
+DASHBOARD_NAMESPACE = "dashboard"
+LOGIN_FAILURE_NAMESPACE = "login_failures"
+
+
+class TTLCache:
+    """
+    Small in-process cache where every entry expires after `expire` seconds.
+    Handlers run on threadpool workers, so every access holds a lock. Entries
+    are kept in insertion order: expired ones are swept from the front on each
+    write and the oldest is evicted past `max_entries`, so the cache stays bounded
+    even for keys that are never read again.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self._store: dict[str, tuple[float, Any]] = {}
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+    def version(self, namespace: str) -> int | None:
+        """Current version of `namespace`; put it in the keys of entries that `invalidate` should retire."""
+        with self._lock:
+            return self._versions.get(namespace, 0)
+
+    def invalidate(self, namespace: str) -> None:
+        """Moves `namespace` to a new version: entries keyed on an older one are never read again."""
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        with self._lock:
+            entry = self._store.get(f"{namespace}:{key}")
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._store.pop(f"{namespace}:{key}", None)
+                return None
+            return value
+
+    def set(self, namespace: str, key: str, value: Any, expire: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            # Re-inserting moves the key to the back, keeping the oldest entries in front
+            self._store.pop(f"{namespace}:{key}", None)
+            self._store[f"{namespace}:{key}"] = (now + expire, value)
+
+            while self._store:
+                oldest_key = next(iter(self._store))
+                if len(self._store) <= self._max_entries and self._store[oldest_key][0] >= now:
+                    break
+                del self._store[oldest_key]
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._store.pop(f"{namespace}:{key}", None)
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Drops every entry in `namespace` (or the whole cache when omitted)."""
+        with self._lock:
+            if namespace is None:
+                self._store.clear()
+                return
+            for key in [k for k in self._store if k.startswith(f"{namespace}:")]:
+                del self._store[key]
+
+
+class RedisCache:
+    """
+    Same interface as TTLCache, shared by every worker through one Redis server.
+    Values must be strings (e.g. a model's JSON). Redis errors are logged and
+    treated as cache misses, so an outage only costs the cached speed-up.
+    """
+
+    def __init__(self, url: str):
+        self._redis = Redis.from_url(url, decode_responses=True)
+
+    def version(self, namespace: str) -> int | None:
+        """Current version of `namespace`, or None when Redis cannot tell (skip caching then)."""
+        try:
+            return int(self._redis.get(f"cache_version:{namespace}") or 0)  # type: ignore
+        except Exception as e:
+            logger.error("Cache version read failed: %s", e)
+            return None
+
+    def invalidate(self, namespace: str) -> None:
+        """Moves `namespace` to a new version with one INCR, instead of scanning for its keys."""
+        try:
+            self._redis.incr(f"cache_version:{namespace}")
+        except Exception as e:
+            logger.error("Cache invalidation failed: %s", e)
+
+    def get(self, namespace: str, key: str) -> str | None:
+        try:
+            return self._redis.get(f"cache:{namespace}:{key}")  # type: ignore
+        except Exception as e:
+            logger.error("Cache read failed: %s", e)
+            return None
+
+    def set(self, namespace: str, key: str, value: str, expire: int) -> None:
+        try:
+            self._redis.set(f"cache:{namespace}:{key}", value, ex=expire)
+        except Exception as e:
+            logger.error("Cache write failed: %s", e)
+
+    def delete(self, namespace: str, key: str) -> None:
+        try:
+            self._redis.delete(f"cache:{namespace}:{key}")
+        except Exception as e:
+            logger.error("Cache delete failed: %s", e)
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Drops every entry in `namespace` (or the whole cache when omitted)."""
+        pattern = f"cache:{namespace}:*" if namespace else "cache:*"
+        try:
+            keys = list(self._redis.scan_iter(match=pattern))
+            if keys:
+                self._redis.delete(*keys)
+        except Exception as e:
+            logger.error("Cache invalidation failed: %s", e)
+
+
+def build_cache(url: str) -> TTLCache | RedisCache:
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCache(url)
+    return TTLCache()
+
+
+cache = build_cache(CACHE_URL)
@@ -1,11 +1,145 @@
+import math
 import os
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import re
+import threading
+import time
+
+from fastapi import HTTPException, Request, status
+from redis.asyncio import Redis
+
+from core.app_logging import logger
 
 
 REDIS_URL = os.getenv("REDIS_URL", "memory://")
 
-limiter = Limiter(
-    key_func=get_remote_address,
-    storage_uri=REDIS_URL
-)
\ No newline at end of file
+RATE_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)s?\s*$")
+PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Refills the bucket for the time elapsed since the last call, then tries to take
+# one token. Runs atomically inside Redis, so every worker shares the same bucket.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_per_second = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'last_refill')
+local tokens = tonumber(bucket[1]) or capacity
+local last_refill = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - last_refill) * refill_per_second)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'last_refill', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / refill_per_second) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    """Turns "5/minute" into (5 requests, tokens refilled per second)."""
+    match = RATE_PATTERN.match(rate)
+    if not match:
+        raise ValueError(f"Invalid rate limit: {rate}")
+    amount = int(match.group(1))
+    return amount, amount / PERIOD_SECONDS[match.group(2)]
+
+
+class MemoryTokenBuckets:
+    """
+    Per-process buckets, used when no Redis server is configured. A bucket idle
+    long enough to refill completely is the same as a new one, so it is dropped
+    (the Redis path gets the same effect from EXPIRE). Buckets are kept in
+    last-used order and swept from the front on every take, and the oldest is
+    evicted past `max_buckets`, so clients cannot grow the dict without bound.
+    """
+
+    def __init__(self, max_buckets: int = 10_000):
+        # key -> (tokens, last_refill, idle_until)
+        self._buckets: dict[str, tuple[float, float, float]] = {}
+        self._lock = threading.Lock()
+        self._max_buckets = max_buckets
+
+    async def take(self, key: str, capacity: int, refill_per_second: float) -> tuple[bool, float]:
+        with self._lock:
+            now = time.monotonic()
+            tokens, last_refill, _ = self._buckets.pop(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - last_refill) * refill_per_second)
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            idle_until = now + (capacity - tokens) / refill_per_second
+            self._buckets[key] = (tokens, now, idle_until)
+
+            while self._buckets:
+                oldest_key = next(iter(self._buckets))
+                if len(self._buckets) <= self._max_buckets and self._buckets[oldest_key][2] > now:
+                    break
+                del self._buckets[oldest_key]
+            return allowed, tokens
+
+
+class RedisTokenBuckets:
+    """Buckets shared by every worker and replica through one Redis server."""
+
+    def __init__(self, url: str):
+        self._redis = Redis.from_url(url)
+        self._script = self._redis.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def take(self, key: str, capacity: int, refill_per_second: float) -> tuple[bool, float]:
+        allowed, tokens = await self._script(keys=[key], args=[capacity, refill_per_second])
+        return bool(allowed), float(tokens)
+
+
+class TokenBucketLimiter:
+    def __init__(self, storage_uri: str):
+        self.enabled = True
+        if storage_uri.startswith(("redis://", "rediss://", "unix://")):
+            self._buckets = RedisTokenBuckets(storage_uri)
+        else:
+            self._buckets = MemoryTokenBuckets()
+
+    def limit(self, rate: str, burst: int | None = None):
+        """
+        Builds a route dependency allowing `rate` requests per client IP.
+        `burst` lets idle clients bank up to that many requests on top of the
+        steady rate (defaults to the rate's own amount, i.e. no extra burst).
+        Use as `dependencies=[Depends(limiter.limit("5/minute", burst=10))]`.
+        """
+        amount, refill_per_second = parse_rate(rate)
+        capacity = burst or amount
+
+        async def rate_limit(request: Request):
+            if not self.enabled:
+                return
+
+            route = request.scope.get("route")
+            route_path = getattr(route, "path", request.url.path)
+            client_ip = request.client.host if request.client else "unknown"
+            key = f"rate:{request.method}:{route_path}:{client_ip}"
+
+            try:
+                allowed, tokens = await self._buckets.take(key, capacity, refill_per_second)
+            except Exception as e:
+                # Fail open: an unreachable Redis must not take the whole API down
+                logger.error("Rate limiter unavailable, allowing request: %s", e)
+                return
+
+            if not allowed:
+                retry_after = math.ceil((1 - tokens) / refill_per_second)
+                logger.warning("Rate limit exceeded on %s by %s", route_path, client_ip)
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=f"Rate limit exceeded: {rate}",
+                    headers={"Retry-After": str(retry_after)},
+                )
+
+        return rate_limit
+
+
+limiter = TokenBucketLimiter(REDIS_URL)
@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+
+from dependancies.dependancies import request_now
+
+
+class RequestClockMiddleware:
+    """
+    Pins utc_now() to the moment each HTTP request arrived. Row timestamps, token
+    expiries and late-fee dates then agree within a request, and the clock is read
+    once instead of by every default factory. Outside a request (migrations,
+    scripts, tests calling helpers directly) utc_now() reads the real clock.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_now.set(datetime.now(timezone.utc))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_now.reset(token)
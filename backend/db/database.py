@@ -1,5 +1,6 @@
 from dotenv import load_dotenv
 import os
+from sqlalchemy import event, make_url
 from sqlmodel import create_engine, Session
 from core.app_logging import logger
 
@@ -9,9 +10,46 @@ if not database_url:
     logger.critical("Database not loaded. Check enironment variable")
     raise ValueError("Check the environment variable")
 
-connect_args={"check_same_thread":False}
-engine = create_engine(database_url, connect_args=connect_args)
+
+def engine_options(url: str) -> dict:
+    """
+    create_engine() keyword arguments for `url`. In-memory SQLite gets a
+    single-connection pool that rejects pool sizing, so it keeps the defaults.
+    """
+    db_url = make_url(url)
+    options: dict = {}
+    if db_url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if db_url.database in (None, "", ":memory:") or db_url.query.get("mode") == "memory":
+            return options
+
+    # Sync handlers run in up to 40 worker threads; let most of them hold a connection.
+    # Pre-ping and recycle drop connections a database server has closed on its side.
+    options.update(pool_size=20, max_overflow=10, pool_pre_ping=True, pool_recycle=1800)
+    return options
+
+
+engine = create_engine(database_url, **engine_options(database_url))
+
+
+@event.listens_for(engine, "connect")
+def configure_sqlite(dbapi_connection, connection_record):
+    """
+    WAL lets readers keep going while a write commits, and synchronous=NORMAL
+    is durable in WAL mode with one fsync fewer per commit. busy_timeout makes
+    a writer wait for the lock instead of failing with "database is locked".
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
 
 def get_session():
-    with Session(engine) as session:
+    # Committed objects keep their loaded state: handlers return them right after
+    # the commit, and the flush has already filled in ids and defaults.
+    with Session(engine, expire_on_commit=False) as session:
         yield session
\ No newline at end of file
@@ -5,12 +5,14 @@ from dependancies.auth import current_user
 from models.users import User
 
 
-def admin_required(current_user: User = Depends(current_user)):
+async def admin_required(current_user: User = Depends(current_user)):
     """
     Check if the authenticated user has admin privileges.
+    No I/O happens here, so it runs on the event loop instead of taking a
+    worker thread on every admin request.
     """
     if not current_user.is_admin:
-        logger.warning(f"Unauthorized admin access attempt by: {current_user.email}")
+        logger.warning("Unauthorized admin access attempt by: %s", current_user.email)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have sufficient privileges to perform this action",
@@ -1,4 +1,6 @@
+import hashlib
 import os
+import threading
 from datetime import timedelta
 
 import jwt
@@ -7,7 +9,8 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pwdlib import PasswordHash
-from sqlmodel import Session, select
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlmodel import Session, bindparam, exists, select
 
 from core.app_logging import logger
 from db.database import get_session
@@ -21,31 +24,88 @@ EXPIRATION_TIME_MINUTES = int(
     check_none_env_variable(os.getenv("EXPIRATION_TIME_MINUTES"))
 )
 EXPIRATION_TIME_DAYS = int(check_none_env_variable(os.getenv("EXPIRATION_TIME_DAYS")))
-ALGORITHM = check_none_env_variable(os.getenv("ALGORITHM"))
 
-password_hash = PasswordHash.recommended()
+# Derived once at import instead of on every token minted or checked
+SIGNING_KEY = SECRET_KEY.encode()
+ACCESS_TOKEN_LIFETIME = timedelta(minutes=EXPIRATION_TIME_MINUTES)
+REFRESH_TOKEN_LIFETIME = timedelta(days=EXPIRATION_TIME_DAYS)
+
+# Argon2id cost, pinned instead of left to the library's defaults. Login latency
+# and the memory each concurrent login holds both scale with these, so they can
+# be tuned per server (aim for well under 250 ms per hash).
+ARGON2_MEMORY_KIB = int(os.getenv("ARGON2_MEMORY_KIB", "47104"))
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "2"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "2"))
+# Each hash keeps ARGON2_PARALLELISM cores and ARGON2_MEMORY_KIB of memory busy.
+# A login burst beyond what the CPUs can run at once only makes every hash
+# slower (and multiplies the memory held), so extra callers wait their turn.
+ARGON2_MAX_CONCURRENT_HASHES = int(
+    os.getenv(
+        "ARGON2_MAX_CONCURRENT_HASHES",
+        str(max(1, (os.cpu_count() or 1) // ARGON2_PARALLELISM)),
+    )
+)
+_hashing_slots = threading.BoundedSemaphore(ARGON2_MAX_CONCURRENT_HASHES)
+
+password_hash = PasswordHash(
+    (
+        Argon2Hasher(
+            memory_cost=ARGON2_MEMORY_KIB,
+            time_cost=ARGON2_TIME_COST,
+            parallelism=ARGON2_PARALLELISM,
+            hash_len=32,
+            salt_len=16,
+        ),
+    )
+)
+# Checked against when the user does not exist, so that path costs a full hash too
+DUMMY_PASSWORD_HASH = password_hash.hash("not-a-real-password")
 oauth2_scheme = OAuth2PasswordBearer("/login")
 
+# The token's user in one round-trip, provided the token has not been revoked
+CURRENT_USER_STATEMENT = select(User).where(
+    User.id == bindparam("user_id"),
+    ~exists().where(TokenBlocklist.token_hash == bindparam("token_hash")),
+)
+
 
 def create_password_hash(plain_password: str) -> str:
-    return password_hash.hash(plain_password)
+    with _hashing_slots:
+        return password_hash.hash(plain_password)
+
 
+def verify_password_hash(plain_password: str, hashed_password: str) -> bool:
+    with _hashing_slots:
+        return password_hash.verify(plain_password, hashed_password)
 
-def verify_password_hash(hashed_password: str, plain_password: str) -> bool:
-    return password_hash.verify(hashed_password, plain_password)
+
+def verify_and_update_password_hash(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verifies the password and, when the stored hash was made with other Argon2
+    parameters, also returns a fresh hash to store (None when it is current).
+    """
+    with _hashing_slots:
+        return password_hash.verify_and_update(plain_password, hashed_password)
+
+
+def token_digest(token: str) -> bytes:
+    """SHA-256 of a JWT, the form in which revoked tokens are stored and looked up."""
+    return hashlib.sha256(token.encode()).digest()
 
 
 def _create_token(data: dict, expire_delta: timedelta, token_type: str):
     to_encode = data.copy()
     expiration = utc_now() + expire_delta
     to_encode.update({"exp": expiration, "type": token_type})
-    return jwt.encode(to_encode, key=SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, key=SIGNING_KEY, algorithm=ALGORITHM)
 
 
 def create_access_token(user_id: int):
     return _create_token(
         data={"sub": str(user_id)},
-        expire_delta=timedelta(minutes=EXPIRATION_TIME_MINUTES),
+        expire_delta=ACCESS_TOKEN_LIFETIME,
         token_type="access",
     )
 
@@ -53,7 +113,7 @@ def create_access_token(user_id: int):
 def create_refresh_token(user_id: int):
     return _create_token(
         data={"sub": str(user_id)},
-        expire_delta=timedelta(days=EXPIRATION_TIME_DAYS),
+        expire_delta=REFRESH_TOKEN_LIFETIME,
         token_type="refresh",
     )
 
@@ -66,15 +126,9 @@ def current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    is_blacklisted = session.exec(
-        select(TokenBlocklist).where(TokenBlocklist.token == token)
-    ).first()
-    if is_blacklisted:
-        logger.warning("Attempted use of blacklisted token.")
-        raise auth_exception
-
+    # The signature check needs no database, so bad tokens never reach it
     try:
-        payload = jwt.decode(token, key=SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, key=SIGNING_KEY, algorithms=[ALGORITHM])
         user_id: str | None = payload.get("sub")
         token_type: str | None = payload.get("type")
 
@@ -82,12 +136,16 @@ def current_user(
             raise auth_exception
 
     except InvalidTokenError as e:
-        logger.error(f"JWT Decode error: {str(e)}")
+        logger.error("JWT Decode error: %s", e)
         raise auth_exception
 
-    user = session.get(User, user_id)
+    user = session.exec(
+        CURRENT_USER_STATEMENT,
+        params={"user_id": int(user_id), "token_hash": token_digest(token)},
+    ).first()
 
     if not user:
+        logger.warning("Rejected token: unknown user or blacklisted token.")
         raise auth_exception
 
     return user
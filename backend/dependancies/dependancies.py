@@ -1,9 +1,13 @@
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from core.app_logging import logger
 
+# "Now" for the HTTP request being served, pinned by core.request_clock
+request_now: ContextVar[datetime | None] = ContextVar("request_now", default=None)
+
 def utc_now():
-    """Returns the current date time in utc """
-    return datetime.now(timezone.utc)
+    """Returns the current date time in utc (one fixed instant per HTTP request)"""
+    return request_now.get() or datetime.now(timezone.utc)
 
 def check_none_env_variable(env_variable):
     """Checks whether the environment variable is none and it raise runtime error if it is none"""
@@ -1,32 +1,31 @@
-from contextlib import asynccontextmanager
-
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
+from fastapi.responses import ORJSONResponse
 
 from api.services import admin_router, loan_router, member_router, payment_router, savings_router
 from api.users import user_router
 from core.rate_limiting import limiter
+from core.request_clock import RequestClockMiddleware
 
 
 origins = [
-    "http://localhost:5173",  # Standard Vite/React port
-    "http://localhost:3000",  # Standard Create React App/Next.js port
     "https://ikimina.duckdns.org",
-    "*",  # Allow all for development (change later!)
 ]
-app = FastAPI(title="Ikimina management system")
+# Local dev servers on any port (Vite on 5173, CRA/Next.js on 3000, ...). A "*"
+# origin cannot be combined with credentials, so they are matched explicitly.
+local_origin_regex = r"https?://(localhost|127\.0\.0\.1)(:\d+)?"
+# Responses are rendered with orjson instead of the standard library json module
+app = FastAPI(title="Ikimina management system", default_response_class=ORJSONResponse)
 app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
+    allow_origin_regex=local_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],  # Allows GET, POST, PUT, DELETE, etc.
     allow_headers=["*"],  # Allows all headers (like Authorization for your JWT)
 )
+app.add_middleware(RequestClockMiddleware)
 
 app.include_router(user_router)
 app.include_router(member_router)
@@ -0,0 +1,40 @@
+"""member search trigram index
+
+Revision ID: 1f6b8d0c3a52
+Revises: 9c3e5a7d2f41
+Create Date: 2026-10-15 10:41:53.902517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1f6b8d0c3a52'
+down_revision: Union[str, Sequence[str], None] = '9c3e5a7d2f41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Trigram GIN indexes are PostgreSQL-only; SQLite keeps scanning the table.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_member_search_trgm ON member USING gin "
+        "((first_name || ' ' || last_name || ' ' || phone_number) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP INDEX IF EXISTS ix_member_search_trgm')
@@ -0,0 +1,36 @@
+"""one active loan per member
+
+Revision ID: 4b1d2c7e9a10
+Revises: ee0d7a9349f8
+Create Date: 2026-10-15 09:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1d2c7e9a10'
+down_revision: Union[str, Sequence[str], None] = 'ee0d7a9349f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'uq_loan_member_active',
+        'loan',
+        ['member_id'],
+        unique=True,
+        sqlite_where=sa.text("status = 'active'"),
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_loan_member_active', table_name='loan')
@@ -0,0 +1,34 @@
+"""member created_at index
+
+Revision ID: 5a8e2b6f0d13
+Revises: 1f6b8d0c3a52
+Create Date: 2026-10-15 12:18:06.471835
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a8e2b6f0d13'
+down_revision: Union[str, Sequence[str], None] = '1f6b8d0c3a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_member_created_at_id',
+        'member',
+        ['created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_member_created_at_id', table_name='member')
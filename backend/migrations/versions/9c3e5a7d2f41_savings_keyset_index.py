@@ -0,0 +1,34 @@
+"""savings keyset index
+
+Revision ID: 9c3e5a7d2f41
+Revises: 4b1d2c7e9a10
+Create Date: 2026-10-15 10:02:17.334120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e5a7d2f41'
+down_revision: Union[str, Sequence[str], None] = '4b1d2c7e9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_savings_member_id_updated_at_id',
+        'savings',
+        ['member_id', 'updated_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_savings_member_id_updated_at_id', table_name='savings')
@@ -0,0 +1,68 @@
+"""blocklist token hash
+
+Revision ID: a8f3d2b5c7e1
+Revises: e5a1c9d3f706
+Create Date: 2026-10-15 16:42:08.513902
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8f3d2b5c7e1'
+down_revision: Union[str, Sequence[str], None] = 'e5a1c9d3f706'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+tokenblocklist = sa.table(
+    'tokenblocklist',
+    sa.column('id', sa.Integer),
+    sa.column('token', sa.String),
+    sa.column('token_hash', sa.LargeBinary),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('tokenblocklist') as batch_op:
+        batch_op.add_column(sa.Column('token_hash', sa.LargeBinary(length=32), nullable=True))
+
+    # Tokens revoked before this revision stay revoked: store their digests
+    connection = op.get_bind()
+    digests = [
+        {'row_id': row_id, 'digest': hashlib.sha256(token.encode()).digest()}
+        for row_id, token in connection.execute(
+            sa.select(tokenblocklist.c.id, tokenblocklist.c.token)
+        )
+    ]
+    if digests:
+        connection.execute(
+            tokenblocklist.update()
+            .where(tokenblocklist.c.id == sa.bindparam('row_id'))
+            .values(token_hash=sa.bindparam('digest')),
+            digests,
+        )
+
+    with op.batch_alter_table('tokenblocklist') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_tokenblocklist_token'))
+        batch_op.drop_column('token')
+        batch_op.alter_column('token_hash', existing_type=sa.LargeBinary(length=32), nullable=False)
+        batch_op.create_index(batch_op.f('ix_tokenblocklist_token_hash'), ['token_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Digests cannot be turned back into tokens, so the revocations are dropped;
+    # the affected tokens become usable again until they expire
+    op.execute('DELETE FROM tokenblocklist')
+    with op.batch_alter_table('tokenblocklist') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_tokenblocklist_token_hash'))
+        batch_op.drop_column('token_hash')
+        batch_op.add_column(sa.Column('token', sqlmodel.sql.sqltypes.AutoString(), nullable=False))
+        batch_op.create_index(batch_op.f('ix_tokenblocklist_token'), ['token'], unique=True)
@@ -0,0 +1,45 @@
+"""loan and payment indexes
+
+Revision ID: b3e9a6c1d4f7
+Revises: d7c4f1a2b8e6
+Create Date: 2026-10-15 13:21:09.533170
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e9a6c1d4f7'
+down_revision: Union[str, Sequence[str], None] = 'd7c4f1a2b8e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_payments_loan_id', 'payments', ['loan_id'], unique=False)
+    op.create_index(
+        'ix_loan_member_id_status',
+        'loan',
+        ['member_id', 'status'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_loan_status_active',
+        'loan',
+        ['status'],
+        unique=False,
+        sqlite_where=sa.text("status = 'active'"),
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_loan_status_active', table_name='loan')
+    op.drop_index('ix_loan_member_id_status', table_name='loan')
+    op.drop_index('ix_payments_loan_id', table_name='payments')
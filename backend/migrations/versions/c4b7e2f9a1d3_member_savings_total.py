@@ -0,0 +1,43 @@
+"""member savings total
+
+Revision ID: c4b7e2f9a1d3
+Revises: a8f3d2b5c7e1
+Create Date: 2026-10-15 17:21:47.306115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4b7e2f9a1d3'
+down_revision: Union[str, Sequence[str], None] = 'a8f3d2b5c7e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'member',
+        sa.Column(
+            'total_savings_cache',
+            sa.Numeric(precision=14, scale=2),
+            nullable=False,
+            server_default='0',
+        ),
+    )
+
+    # Start every member from the savings already on record
+    op.execute(
+        'UPDATE member SET total_savings_cache = '
+        '(SELECT COALESCE(SUM(savings.amount), 0) FROM savings WHERE savings.member_id = member.id)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('member', 'total_savings_cache')
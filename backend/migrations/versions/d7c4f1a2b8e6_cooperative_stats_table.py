@@ -0,0 +1,53 @@
+"""cooperative stats table
+
+Revision ID: d7c4f1a2b8e6
+Revises: 5a8e2b6f0d13
+Create Date: 2026-10-15 13:02:44.918203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7c4f1a2b8e6'
+down_revision: Union[str, Sequence[str], None] = '5a8e2b6f0d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'cooperative_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('total_members', sa.Integer(), nullable=False),
+        sa.Column('total_savings', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column('total_loans_issued_count', sa.Integer(), nullable=False),
+        sa.Column('total_principal_loaned', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column('total_principal_collected', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column('total_interest_collected', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+    # Seed the single row from the data already on record. The write endpoints
+    # only ever adjust it, so it must exist before the app takes traffic.
+    op.execute(
+        'INSERT INTO cooperative_stats (id, total_members, total_savings, total_loans_issued_count, '
+        'total_principal_loaned, total_principal_collected, total_interest_collected) '
+        'SELECT 1, '
+        '(SELECT COUNT(id) FROM member), '
+        '(SELECT COALESCE(SUM(amount), 0) FROM savings), '
+        '(SELECT COUNT(id) FROM loan), '
+        '(SELECT COALESCE(SUM(amount), 0) FROM loan), '
+        '(SELECT COALESCE(SUM(principal_amount), 0) FROM payments), '
+        '(SELECT COALESCE(SUM(interest_amount), 0) FROM payments)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cooperative_stats')
@@ -0,0 +1,36 @@
+"""unique blocklist token
+
+Revision ID: e5a1c9d3f706
+Revises: b3e9a6c1d4f7
+Create Date: 2026-10-15 14:05:31.207446
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c9d3f706'
+down_revision: Union[str, Sequence[str], None] = 'b3e9a6c1d4f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the first revocation of any token that was blocked more than once
+    op.execute(
+        'DELETE FROM tokenblocklist WHERE id NOT IN '
+        '(SELECT MIN(id) FROM tokenblocklist GROUP BY token)'
+    )
+    op.drop_index(op.f('ix_tokenblocklist_token'), table_name='tokenblocklist')
+    op.create_index(op.f('ix_tokenblocklist_token'), 'tokenblocklist', ['token'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tokenblocklist_token'), table_name='tokenblocklist')
+    op.create_index(op.f('ix_tokenblocklist_token'), 'tokenblocklist', ['token'], unique=False)
@@ -1,9 +1,10 @@
+import calendar
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from dateutil.relativedelta import relativedelta
 from pydantic import BaseModel, computed_field
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 from dependancies.dependancies import utc_now
@@ -28,6 +29,9 @@ class BasePayments(SQLModel):
 
 
 class Payments(BasePayments, table=True):
+    # Every balance, summary and late-fee aggregate groups a loan's payments
+    __table_args__ = (Index("ix_payments_loan_id", "loan_id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     loan_id: int = Field(foreign_key="loan.id", ondelete="CASCADE")
 
@@ -54,6 +58,113 @@ class PaymentDelete(SQLModel):
     
 # 2. LOAN MODELS
 
+# Money constants, parsed once instead of on every calculation
+ZERO_AMOUNT = Decimal("0.00")
+CENT = Decimal("0.01")
+MONTHLY_INTEREST_RATE = Decimal("0.015")
+LATE_FEE_RATE = Decimal("0.03")
+
+# The same rates as exact integer fractions (3/200 and 3/100), for cents arithmetic
+INTEREST_RATE_NUMERATOR, INTEREST_RATE_DENOMINATOR = MONTHLY_INTEREST_RATE.as_integer_ratio()
+LATE_FEE_RATE_NUMERATOR, LATE_FEE_RATE_DENOMINATOR = LATE_FEE_RATE.as_integer_ratio()
+
+
+def to_cents(amount: Decimal) -> int:
+    """Converts a 2-decimal money amount to integer cents."""
+    return int(amount.scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Converts integer cents back to a 2-decimal money amount."""
+    return Decimal(cents).scaleb(-2)
+
+
+def _divide_half_even(numerator: int, denominator: int) -> int:
+    """Integer division rounded half-even, the same rounding round() applies to Decimals."""
+    quotient, remainder = divmod(numerator, denominator)
+    if remainder * 2 > denominator or (remainder * 2 == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def calculate_interest_due_cents(remaining_balance_cents: int) -> int:
+    """1.5% interest on the remaining principal, in integer cents."""
+    if remaining_balance_cents <= 0:
+        return 0
+    return _divide_half_even(
+        remaining_balance_cents * INTEREST_RATE_NUMERATOR, INTEREST_RATE_DENOMINATOR
+    )
+
+
+def calculate_interest_due(remaining_balance: Decimal) -> Decimal:
+    """1.5% interest on the remaining principal (nothing once it is cleared)."""
+    return from_cents(calculate_interest_due_cents(to_cents(remaining_balance)))
+
+
+def split_payment_cents(
+    cash_cents: int, late_fees_due_cents: int, interest_due_cents: int
+) -> tuple[int, int, int]:
+    """
+    The repayment waterfall: a payment clears late fees first, then interest,
+    and whatever is left goes to the principal. Returns (late fees, interest,
+    principal) in integer cents.
+    """
+    late_fees_paid = min(cash_cents, late_fees_due_cents)
+    interest_paid = min(cash_cents - late_fees_paid, interest_due_cents)
+    return late_fees_paid, interest_paid, cash_cents - late_fees_paid - interest_paid
+
+
+def add_months(day: date, months: int) -> date:
+    """`day` moved `months` months ahead, clamped to the end of a shorter month."""
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def calculate_next_due_date(
+    approved_at: datetime, monthly_payment: Decimal, total_cash_paid: Decimal
+) -> date:
+    """Due date of the next installment, given everything paid on the loan so far."""
+    installments_paid = 0
+    if monthly_payment > ZERO_AMOUNT:
+        installments_paid = int(total_cash_paid // monthly_payment)
+    return add_months(approved_at.date(), installments_paid + 1)
+
+
+def calculate_late_fee_cents(
+    next_due_date: date, monthly_payment_cents: int, today: date
+) -> int:
+    """
+    3% of the monthly installment for every month the next due date has slipped,
+    in integer cents (rounded half-even, like round() on the Decimal amount).
+    """
+    if today <= next_due_date:
+        return 0
+
+    months_late = (today.year - next_due_date.year) * 12 + (
+        today.month - next_due_date.month
+    )
+    if today.day >= next_due_date.day:
+        months_late += 1
+
+    if months_late <= 0:
+        return 0
+
+    return _divide_half_even(
+        monthly_payment_cents * LATE_FEE_RATE_NUMERATOR * months_late,
+        LATE_FEE_RATE_DENOMINATOR,
+    )
+
+
+def calculate_late_fees(
+    next_due_date: date, monthly_payment: Decimal, today: date
+) -> Decimal:
+    """3% of the monthly installment for every month the next due date has slipped."""
+    return from_cents(
+        calculate_late_fee_cents(next_due_date, to_cents(monthly_payment), today)
+    )
+
+
 class BaseLoan(SQLModel):
     amount: Decimal = Field(max_digits=12, decimal_places=2)
     monthly_payment: Decimal = Field(
@@ -62,6 +173,26 @@ class BaseLoan(SQLModel):
 
 
 class Loan(BaseLoan, table=True):
+    # A member may only carry one active loan at a time
+    __table_args__ = (
+        Index(
+            "uq_loan_member_active",
+            "member_id",
+            unique=True,
+            sqlite_where=text("status = 'active'"),
+            postgresql_where=text("status = 'active'"),
+        ),
+        # A member's loans filtered by status (profile, open-loan and delete checks)
+        Index("ix_loan_member_id_status", "member_id", "status"),
+        # The dashboard's late-fee projection only reads active loans
+        Index(
+            "ix_loan_status_active",
+            "status",
+            sqlite_where=text("status = 'active'"),
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     approved_at: datetime = Field(default_factory=utc_now)
     status: str = Field(default="active")
@@ -74,29 +205,63 @@ class Loan(BaseLoan, table=True):
     )
 
     # --- BUSINESS LOGIC (Dynamic Properties) ---
+    def paid_totals(self) -> tuple[Decimal, Decimal]:
+        """Principal and total cash paid so far, added up in one pass over the payments."""
+        principal_paid = total_cash_paid = ZERO_AMOUNT
+        for p in self.payments:
+            principal_paid += p.principal_amount
+            total_cash_paid += p.principal_amount + p.interest_amount + p.late_fee_amount
+        return principal_paid, total_cash_paid
+
+    def balance_snapshot(
+        self, principal_paid: Decimal, total_cash_paid: Decimal, today: date
+    ) -> dict[str, Any]:
+        """
+        The dynamic loan figures for a response, worked out from payment totals
+        the caller already holds (SQL sums or paid_totals()), so serializing a
+        loan does not walk its payments once per property. `today` is passed in
+        so a response covering many loans reads the clock once.
+        """
+        remaining_balance = self.amount - principal_paid
+        if self.status == "paid":
+            return {
+                "remaining_balance": remaining_balance,
+                "current_interest_due": ZERO_AMOUNT,
+                "next_due_date": None,
+                "accumulated_late_fees": ZERO_AMOUNT,
+            }
+
+        next_due_date = calculate_next_due_date(
+            self.approved_at, self.monthly_payment, total_cash_paid
+        )
+        return {
+            "remaining_balance": remaining_balance,
+            "current_interest_due": calculate_interest_due(remaining_balance),
+            "next_due_date": next_due_date,
+            "accumulated_late_fees": calculate_late_fees(
+                next_due_date, self.monthly_payment, today
+            ),
+        }
+
     @property
     def remaining_balance(self) -> Decimal:
         """Total loan amount minus ONLY the principal paid so far."""
-        total_principal_paid = sum(
-            (p.principal_amount for p in self.payments), Decimal("0.00")
-        )
-        return self.amount - total_principal_paid
+        principal_paid, _ = self.paid_totals()
+        return self.amount - principal_paid
 
     @property
     def current_interest_due(self) -> Decimal:
         """Calculates the 1.5% interest on the exact remaining balance."""
-        if self.status == "paid" or self.remaining_balance <= Decimal("0.00"):
-            return Decimal("0.00")
-
-        interest = self.remaining_balance * Decimal("0.015")
-        return round(interest, 2)
+        if self.status == "paid":
+            return ZERO_AMOUNT
+        return calculate_interest_due(self.remaining_balance)
 
     @property
     def expected_installments_paid(self) -> int:
         """Calculates how many full monthly payments have been made."""
-        if self.monthly_payment <= Decimal("0.00"):
+        if self.monthly_payment <= ZERO_AMOUNT:
             return 0
-        total_cash_paid = sum((p.total_amount for p in self.payments), Decimal("0.00"))
+        _, total_cash_paid = self.paid_totals()
         return int(total_cash_paid // self.monthly_payment)
 
     @property
@@ -104,31 +269,16 @@ class Loan(BaseLoan, table=True):
         """Dynamically calculates the exact date the next payment is required."""
         if self.status == "paid":
             return None
-        return self.approved_at.date() + relativedelta(
-            months=self.expected_installments_paid + 1
+        _, total_cash_paid = self.paid_totals()
+        return calculate_next_due_date(
+            self.approved_at, self.monthly_payment, total_cash_paid
         )
 
     @property
     def accumulated_late_fees(self) -> Decimal:
         """Calculates the 3% late penalty based on missed monthly payments."""
-        if self.status == "paid" or not self.next_due_date:
-            return Decimal("0.00")
-
-        today = utc_now().date()
-        if today > self.next_due_date:
-            months_late = (today.year - self.next_due_date.year) * 12 + (
-                today.month - self.next_due_date.month
-            )
-            if today.day >= self.next_due_date.day:
-                months_late += 1
-
-            if months_late > 0:
-                penalty = (
-                    self.monthly_payment * Decimal("0.03") * Decimal(str(months_late))
-                )
-                return round(penalty, 2)
-
-        return Decimal("0.00")
+        snapshot = self.balance_snapshot(*self.paid_totals(), utc_now().date())
+        return snapshot["accumulated_late_fees"]
 
 
 class CreateLoan(BaseLoan):
@@ -174,6 +324,11 @@ class MemberSaving(SQLModel):
     amount: Decimal
     
 class Savings(MemberSaving, table=True):
+    # Serves the newest-first, keyset-paginated savings history of a member
+    __table_args__ = (
+        Index("ix_savings_member_id_updated_at_id", "member_id", "updated_at", "id"),
+    )
+
     id : int|None = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime = Field(default_factory=utc_now, sa_column_kwargs={"onupdate":utc_now})
@@ -208,11 +363,19 @@ class MemberCreate(MemberBase):
 
 
 class Member(MemberBase, table=True):
+    # Serves the newest-first, keyset-paginated member directory
+    __table_args__ = (Index("ix_member_created_at_id", "created_at", "id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime = Field(
         default_factory=utc_now, sa_column_kwargs={"onupdate": utc_now}
     )
+    # Sum of the member's savings rows, adjusted by every savings write in the
+    # same transaction so reads never have to add the rows up
+    total_savings_cache: Decimal = Field(
+        default=ZERO_AMOUNT, max_digits=14, decimal_places=2
+    )
 
     # Relationships
     loans: List["Loan"] = Relationship(back_populates="member")
@@ -220,7 +383,7 @@ class Member(MemberBase, table=True):
     
     @property
     def total_savings(self):
-        return sum((s.amount for s in self.savings), Decimal("0.00"))
+        return self.total_savings_cache
 
 
 class MemberPublic(MemberBase):
@@ -246,6 +409,24 @@ class MemberDeleted(SQLModel):
     last_name: str
 
 
+# 4. DASHBOARD MODELS
+
+class CooperativeStats(SQLModel, table=True):
+    """
+    Running totals behind the admin dashboard: a single row (id=1) adjusted
+    by every write in the same transaction, so reading it is O(1).
+    """
+    __tablename__ = "cooperative_stats"  # type: ignore
+
+    id: int = Field(default=1, primary_key=True)
+    total_members: int = Field(default=0)
+    total_savings: Decimal = Field(default=ZERO_AMOUNT, max_digits=14, decimal_places=2)
+    total_loans_issued_count: int = Field(default=0)
+    total_principal_loaned: Decimal = Field(default=ZERO_AMOUNT, max_digits=14, decimal_places=2)
+    total_principal_collected: Decimal = Field(default=ZERO_AMOUNT, max_digits=14, decimal_places=2)
+    total_interest_collected: Decimal = Field(default=ZERO_AMOUNT, max_digits=14, decimal_places=2)
+
+
 class AdminDashboardStats(BaseModel):
     total_members: int
     total_savings: Decimal
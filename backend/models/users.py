@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Column, LargeBinary
 from sqlmodel import Field, SQLModel, func
 
 from dependancies.dependancies import utc_now
@@ -44,7 +45,12 @@ class UserRead(UserBase):
 
 class TokenBlocklist(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
-    token: str = Field(index=True)
+    # SHA-256 of the JWT (see dependancies.auth.token_digest): a fixed 32-byte key
+    # keeps the index small and raw tokens out of the database. Unique: revoking a
+    # token twice fails, which is how refresh tokens are spent once.
+    token_hash: bytes = Field(
+        sa_column=Column(LargeBinary(32), index=True, unique=True, nullable=False)
+    )
     token_type: str
     blocked_at: datetime = Field(default_factory=utc_now)
 
@@ -1,12 +1,27 @@
 # conftest.py
+import itertools
+import os
+from contextlib import contextmanager
+
+# 0. Cheap Argon2 parameters for the test run, set before the app is imported.
+# Production strength only costs time here; the tests check the hash format
+# and the rehash flow, which work the same at any cost. Exported values win.
+os.environ.setdefault("ARGON2_MEMORY_KIB", "1024")
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_PARALLELISM", "1")
+
 import pytest
+from sqlalchemy import event
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
+from api.services import record_savings, register_loan, register_member
+from core.caching import cache
 from db.database import get_session
 from dependancies.auth import create_access_token
 from main import app
+from models.models import CooperativeStats, CreateLoan, MemberCreate, MemberSaving
 from models.users import User
 
 # 1. Create an in-memory SQLite database (it vanishes when tests end)
@@ -16,18 +31,57 @@ engine = create_engine(
 )
 
 
-# 2. Fixture to create tables and provide a session
-@pytest.fixture(name="session")
-def session_fixture():
+# pysqlite opens and ends transactions on its own, which breaks SAVEPOINTs.
+# Hand transaction control to SQLAlchemy, as its SQLite docs recommend.
+@event.listens_for(engine, "connect")
+def disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def begin_sqlite_transaction(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# 2. The schema is created once for the whole run, with the dashboard stats row
+# its migration seeds
+@pytest.fixture(name="schema", scope="session")
+def schema_fixture():
     SQLModel.metadata.create_all(engine)  # Create tables
     with Session(engine) as session:
-        yield session
+        session.add(CooperativeStats())
+        session.commit()
+    yield
     SQLModel.metadata.drop_all(engine)  # Clean up
 
 
-# 3. Fixture to override the dependency in FastAPI
+# 3. Fixture to provide a session. Each test runs inside one outer transaction
+# that is rolled back afterwards; the app's commits and rollbacks only release
+# or roll back savepoints within it.
+@pytest.fixture(name="session")
+def session_fixture(schema):
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        transaction.rollback()
+
+
+# 4. One TestClient for the whole run. Entered once, it keeps a single event-loop
+# portal for every request instead of starting a new one per request.
+@pytest.fixture(name="http_client", scope="session")
+def http_client_fixture():
+    with TestClient(app) as client:
+        yield client
+
+
+# 5. Fixture to override the dependency in FastAPI
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
+def client_fixture(session: Session, http_client: TestClient):
     def get_session_override():
         return session
 
@@ -35,24 +89,80 @@ def client_fixture(session: Session):
     
     if hasattr(app.state, "limiter"):
         app.state.limiter.enabled = False
+
+    cache.clear()
         
-    client = TestClient(app)
-    yield client
+    yield http_client
     app.dependency_overrides.clear()
 
 
-# 4. Fixture to create an Admin User and get a Token
-@pytest.fixture(name="admin_token")
-def admin_token_fixture(session: Session):
-    # Create a fake admin
+# 6. Fixture to create an Admin User. It is committed once, outside the
+# per-test transactions, so every test sees the same row.
+@pytest.fixture(name="admin", scope="session")
+def admin_fixture(schema):
     admin = User(
         email="admin@test.com",
         hashed_password="hashed_secret",
         is_active=True,
         is_admin=True,
     )
-    session.add(admin)
-    session.commit()
-    session.refresh(admin)
+    with Session(engine) as session:
+        session.add(admin)
+        session.commit()
+        session.refresh(admin)
+    return admin
+
 
+# 7. Fixture to get the admin's Token, minted a single time
+@pytest.fixture(name="admin_token", scope="session")
+def admin_token_fixture(admin: User):
     return create_access_token(user_id=admin.id)  # type:ignore
+
+
+# 8. Fixture that sets up a loan: a fresh member, their savings, then the loan itself.
+# The route handlers are called directly on the test session, so setup skips three
+# HTTP round-trips; the endpoints themselves are covered by their own tests.
+@pytest.fixture(name="open_loan")
+def open_loan_fixture(client, session: Session, admin: User):
+    phone_numbers = (f"07990{n:05d}" for n in itertools.count())
+
+    def open_loan(amount: str, monthly_payment: str, savings: int) -> dict:
+        member = register_member(
+            MemberCreate.model_validate({
+                "first_name": "Loan",
+                "last_name": "Holder",
+                "date_of_birth": "1990-01-01",
+                "gender": "Female",
+                "phone_number": next(phone_numbers),
+            }),
+            session=session,
+            admin=admin,
+        )
+        record_savings(member.id, MemberSaving(amount=savings), admin=admin, session=session)  # type:ignore
+        loan = register_loan(
+            member.id,  # type:ignore
+            CreateLoan.model_validate({"amount": amount, "monthly_payment": monthly_payment}),
+            session=session,
+        )
+        return loan.model_dump(mode="json")
+
+    return open_loan
+
+
+# 9. Fixture to count the SQL statements a block of code runs (catches N+1 regressions)
+@pytest.fixture(name="count_queries")
+def count_queries_fixture():
+    @contextmanager
+    def count_queries():
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return count_queries
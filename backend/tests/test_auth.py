@@ -0,0 +1,182 @@
+# tests/test_auth.py
+import threading
+import time
+
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlmodel import select
+
+import api.users
+import dependancies.auth
+from dependancies.auth import (
+    ARGON2_MAX_CONCURRENT_HASHES,
+    ARGON2_MEMORY_KIB,
+    ARGON2_PARALLELISM,
+    ARGON2_TIME_COST,
+    create_access_token,
+    create_password_hash,
+    create_refresh_token,
+    token_digest,
+    verify_password_hash,
+)
+from models.users import TokenBlocklist, User
+
+
+def _user(session):
+    user = User(email="member@test.com", hashed_password="hashed_secret")
+    session.add(user)
+    session.commit()
+    return user
+
+
+def test_refresh_token_can_only_be_spent_once(client, session):
+    user = _user(session)
+    refresh_token = create_refresh_token(user.id)  # type: ignore
+
+    first = client.post("/auth/refresh", json={"token": refresh_token})
+    assert first.status_code == 200
+    assert first.json()["refresh_token"]
+
+    replay = client.post("/auth/refresh", json={"token": refresh_token})
+    assert replay.status_code == 401
+
+
+def test_logout_revokes_access_token_even_with_a_spent_refresh_token(client, session):
+    user = _user(session)
+    refresh_token = create_refresh_token(user.id)  # type: ignore
+    client.post("/auth/refresh", json={"token": refresh_token})
+
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}  # type: ignore
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    logout = client.post("/auth/logout", json={"token": refresh_token}, headers=headers)
+    assert logout.json() == {"message": "Successfully logged out"}
+    assert client.get("/auth/me", headers=headers).status_code == 401
+
+
+def test_blocklist_stores_token_digests(client, session):
+    user = _user(session)
+    access_token = create_access_token(user.id)  # type: ignore
+    refresh_token = create_refresh_token(user.id)  # type: ignore
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    client.post("/auth/logout", json={"token": refresh_token}, headers=headers)
+
+    stored = set(session.exec(select(TokenBlocklist.token_hash)).all())
+    assert stored == {token_digest(access_token), token_digest(refresh_token)}
+
+
+def test_repeated_wrong_password_skips_the_hash(client, session, monkeypatch):
+    session.add(User(email="login@test.com", hashed_password=create_password_hash("right-password")))
+    session.commit()
+
+    verified = []
+    real_verify = api.users.verify_and_update_password_hash
+
+    def counting_verify(*args):
+        verified.append(args)
+        return real_verify(*args)
+
+    monkeypatch.setattr(api.users, "verify_and_update_password_hash", counting_verify)
+
+    def login(password):
+        return client.post("/auth/login", data={"username": "login@test.com", "password": password})
+
+    assert login("wrong-password").status_code == 401
+    assert login("wrong-password").status_code == 401
+    assert len(verified) == 1
+
+    # Any other password, the right one included, is still checked
+    assert login("right-password").status_code == 200
+    assert len(verified) == 2
+
+
+def test_register_after_a_failed_login_can_log_in(client):
+    credentials = {"username": "late@test.com", "password": "first-password"}
+
+    # The attempt is made before the account exists, so it is remembered as a failure
+    assert client.post("/auth/login", data=credentials).status_code == 401
+
+    payload = {"email": "late@test.com", "password": "first-password"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+    assert client.post("/auth/login", data=credentials).status_code == 200
+
+
+def test_register_duplicate_email_fails(client):
+    payload = {"email": "new@test.com", "password": "secret-password"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+
+    duplicate = client.post("/auth/register", json=payload)
+    assert duplicate.status_code == 400
+    assert duplicate.json()["detail"] == "User with this email already exists"
+
+
+def test_password_hash_uses_pinned_argon2id_parameters():
+    hashed = create_password_hash("correct horse")
+    assert hashed.startswith(
+        f"$argon2id$v=19$m={ARGON2_MEMORY_KIB},t={ARGON2_TIME_COST},p={ARGON2_PARALLELISM}$"
+    )
+    assert verify_password_hash("correct horse", hashed)
+
+
+def test_unknown_email_still_pays_for_a_hash(client, monkeypatch):
+    verified = []
+    real_verify = api.users.verify_password_hash
+
+    def counting_verify(*args):
+        verified.append(args)
+        return real_verify(*args)
+
+    monkeypatch.setattr(api.users, "verify_password_hash", counting_verify)
+
+    def login():
+        return client.post("/auth/login", data={"username": "ghost@test.com", "password": "anything"})
+
+    assert login().status_code == 401
+    assert len(verified) == 1
+
+    # A retry is remembered just like a wrong password for a real account
+    assert login().status_code == 401
+    assert len(verified) == 1
+
+
+def test_login_rehashes_passwords_stored_with_old_parameters(client, session):
+    old_hasher = PasswordHash((Argon2Hasher(memory_cost=8192, time_cost=1, parallelism=1),))
+    session.add(User(email="legacy@test.com", hashed_password=old_hasher.hash("legacy-password")))
+    session.commit()
+
+    response = client.post("/auth/login", data={"username": "legacy@test.com", "password": "legacy-password"})
+    assert response.status_code == 200
+
+    user = session.exec(select(User).where(User.email == "legacy@test.com")).one()
+    assert user.hashed_password.startswith(f"$argon2id$v=19$m={ARGON2_MEMORY_KIB},")
+    assert verify_password_hash("legacy-password", user.hashed_password)
+
+
+def test_concurrent_password_hashing_is_capped(monkeypatch):
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    class SlowHasher:
+        def verify(self, plain_password, hashed_password):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.pop()
+            return True
+
+    monkeypatch.setattr(dependancies.auth, "password_hash", SlowHasher())
+
+    threads = [
+        threading.Thread(target=verify_password_hash, args=("plain", "hashed"))
+        for _ in range(ARGON2_MAX_CONCURRENT_HASHES + 4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) <= ARGON2_MAX_CONCURRENT_HASHES
@@ -0,0 +1,38 @@
+# tests/test_caching.py
+import time
+
+from core.caching import TTLCache
+
+
+def test_ttl_cache_stays_bounded():
+    cache = TTLCache(max_entries=3)
+    for n in range(10):
+        cache.set("ns", str(n), n, expire=60)
+
+    # Only the newest entries survive
+    assert [cache.get("ns", str(n)) for n in range(10)] == [None] * 7 + [7, 8, 9]
+
+
+def test_ttl_cache_sweeps_expired_entries_on_write(monkeypatch):
+    cache = TTLCache()
+    cache.set("ns", "stale", "old", expire=1)
+
+    later = time.monotonic() + 5
+    monkeypatch.setattr(time, "monotonic", lambda: later)
+    cache.set("ns", "fresh", "new", expire=1)
+
+    # The expired entry is gone without anyone reading it
+    assert list(cache._store) == ["ns:fresh"]
+
+
+def test_ttl_cache_invalidate_retires_results_computed_before_it():
+    cache = TTLCache()
+
+    # A reader misses and starts computing under the current version...
+    version = cache.version("dashboard")
+    # ...a write commits and invalidates...
+    cache.invalidate("dashboard")
+    # ...and the reader's late, stale result lands under the old version
+    cache.set("dashboard", f"stats:{version}", "stale", expire=60)
+
+    assert cache.get("dashboard", f"stats:{cache.version('dashboard')}") is None
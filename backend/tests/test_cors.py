@@ -0,0 +1,25 @@
+# tests/test_cors.py
+
+
+def _preflight(client, origin):
+    return client.options(
+        "/auth/",
+        headers={"Origin": origin, "Access-Control-Request-Method": "GET"},
+    )
+
+
+def test_known_origins_are_allowed_with_credentials(client):
+    for origin in ("https://ikimina.duckdns.org", "http://localhost:5173", "http://127.0.0.1:3000"):
+        response = _preflight(client, origin)
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == origin
+        assert response.headers["access-control-allow-credentials"] == "true"
+
+
+def test_unknown_origins_are_rejected(client):
+    response = _preflight(client, "https://evil.example.com")
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+
+    simple = client.get("/auth/", headers={"Origin": "https://evil.example.com"})
+    assert "access-control-allow-origin" not in simple.headers
@@ -0,0 +1,182 @@
+# tests/test_dashboard.py
+from datetime import timedelta
+from decimal import Decimal
+
+from core.caching import cache
+from models.models import CooperativeStats, Loan
+
+
+def test_dashboard_stats_empty_database(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    response = client.get("/admin/dashboard-stats", headers=headers)
+
+    assert response.status_code == 200, f"Dashboard failed: {response.text}"
+    data = response.json()
+    assert data["total_members"] == 0
+    assert data["total_loans_issued_count"] == 0
+    assert float(data["total_savings"]) == 0
+    assert float(data["outstanding_principal"]) == 0
+    assert float(data["projected_late_fees"]) == 0
+
+
+def test_dashboard_stats_aggregates(client, admin_token, session):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    # 1. Two members, both with savings
+    member_ids = []
+    for phone in ["0786000001", "0786000002"]:
+        member_res = client.post(
+            "/member/",
+            json={"first_name": "Dash", "last_name": "Board", "date_of_birth": "1990-01-01", "gender": "Male", "phone_number": phone},
+            headers=headers,
+        )
+        member_ids.append(member_res.json()["id"])
+    client.post(f"/savings/{member_ids[0]}", json={"amount": 1000}, headers=headers)
+    client.post(f"/savings/{member_ids[1]}", json={"amount": 500}, headers=headers)
+
+    # 2. One loan with a single payment (1.5% of 1000 = 15 interest, 85 principal)
+    loan_res = client.post(
+        f"/loan/{member_ids[0]}",
+        json={"amount": "1000.00", "monthly_payment": "100.00"},
+        headers=headers,
+    )
+    loan_id = loan_res.json()["id"]
+    client.post(f"/payment/{loan_id}", json={"amount": "100.00"}, headers=headers)
+
+    # 3. A second loan, pushed 65 days into the past so it is 2 installments late
+    late_res = client.post(
+        f"/loan/{member_ids[1]}",
+        json={"amount": "500.00", "monthly_payment": "100.00"},
+        headers=headers,
+    )
+    db_loan = session.get(Loan, late_res.json()["id"])
+    db_loan.approved_at = db_loan.approved_at - timedelta(days=65)
+    session.add(db_loan)
+    session.commit()
+
+    response = client.get("/admin/dashboard-stats", headers=headers)
+    assert response.status_code == 200, f"Dashboard failed: {response.text}"
+    data = response.json()
+
+    assert data["total_members"] == 2
+    assert float(data["total_savings"]) == 1500.00
+    assert data["total_loans_issued_count"] == 2
+    assert float(data["total_principal_loaned"]) == 1500.00
+    assert float(data["total_principal_collected"]) == 85.00
+    assert float(data["total_interest_collected"]) == 15.00
+    assert float(data["outstanding_principal"]) == 1415.00
+    # Only the back-dated loan is late: 2 months * 3% * 100 = 6.00
+    assert float(data["projected_late_fees"]) == 6.00
+
+
+def test_dashboard_stats_cache_invalidated_by_writes(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    first = client.get("/admin/dashboard-stats", headers=headers)
+    assert first.json()["total_members"] == 0
+
+    client.post(
+        "/member/",
+        json={"first_name": "Fresh", "last_name": "Stats", "date_of_birth": "1990-01-01", "gender": "Female", "phone_number": "0786000003"},
+        headers=headers,
+    )
+
+    # The cached payload must not outlive a write that changes the totals
+    second = client.get("/admin/dashboard-stats", headers=headers)
+    assert second.json()["total_members"] == 1
+
+
+def test_projected_late_fees_match_loan_properties(client, admin_token, session):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    # Loans approved on awkward days (month ends, leap day) at various ages
+    approval_offsets = [31, 59, 95, 181, 366, 400]
+    loan_ids = []
+    for index, days_ago in enumerate(approval_offsets):
+        member_id = client.post(
+            "/member/",
+            json={"first_name": "Late", "last_name": f"Payer{index}", "date_of_birth": "1990-01-01", "gender": "Male", "phone_number": f"078610000{index}"},
+            headers=headers,
+        ).json()["id"]
+        client.post(f"/savings/{member_id}", json={"amount": 10000}, headers=headers)
+        loan_id = client.post(
+            f"/loan/{member_id}",
+            json={"amount": "5000.00", "monthly_payment": "333.33"},
+            headers=headers,
+        ).json()["id"]
+        client.post(f"/payment/{loan_id}", json={"amount": "100.00"}, headers=headers)
+
+        db_loan = session.get(Loan, loan_id)
+        approved_at = db_loan.approved_at - timedelta(days=days_ago)
+        # Snap to the last day of that month to exercise the due-date clamping
+        next_month = (approved_at.replace(day=1) + timedelta(days=32)).replace(day=1)
+        db_loan.approved_at = next_month - timedelta(days=1)
+        session.add(db_loan)
+        loan_ids.append(loan_id)
+    session.commit()
+
+    expected = sum(session.get(Loan, loan_id).accumulated_late_fees for loan_id in loan_ids)
+    assert expected > 0
+
+    response = client.get("/admin/dashboard-stats", headers=headers)
+    assert response.status_code == 200, f"Dashboard failed: {response.text}"
+    assert Decimal(response.json()["projected_late_fees"]) == expected
+
+
+def test_dashboard_stats_cache_invalidated_by_deletes(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    member_id = client.post(
+        "/member/",
+        json={"first_name": "Short", "last_name": "Stay", "date_of_birth": "1990-01-01", "gender": "Male", "phone_number": "0786000004"},
+        headers=headers,
+    ).json()["id"]
+    assert client.get("/admin/dashboard-stats", headers=headers).json()["total_members"] == 1
+
+    client.delete(f"/member/{member_id}", headers=headers)
+
+    assert client.get("/admin/dashboard-stats", headers=headers).json()["total_members"] == 0
+
+
+def test_running_totals_match_a_full_rebuild(client, admin_token, session):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    def new_member(phone):
+        return client.post(
+            "/member/",
+            json={"first_name": "Running", "last_name": "Total", "date_of_birth": "1990-01-01", "gender": "Male", "phone_number": phone},
+            headers=headers,
+        ).json()["id"]
+
+    # Every kind of write the dashboard totals depend on
+    keeper, leaver = new_member("0786200001"), new_member("0786200002")
+    savings_id = client.post(f"/savings/{keeper}", json={"amount": 5000}, headers=headers).json()["id"]
+    client.patch(f"/savings/{savings_id}", json={"amount": 6000}, headers=headers)
+    dropped_savings = client.post(f"/savings/{keeper}", json={"amount": 10}, headers=headers).json()["id"]
+    client.delete(f"/savings/{dropped_savings}", headers=headers)
+
+    loan_id = client.post(f"/loan/{keeper}", json={"amount": "2000.00", "monthly_payment": "200.00"}, headers=headers).json()["id"]
+    client.patch(f"/loan/{loan_id}", json={"amount": "2500.00", "monthly_payment": "250.00"}, headers=headers)
+    first_payment = client.post(f"/payment/{loan_id}", json={"amount": "250.00"}, headers=headers).json()["id"]
+    client.patch(f"/payment/{first_payment}", json={"amount": "300.00"}, headers=headers)
+    dropped_payment = client.post(f"/payment/{loan_id}", json={"amount": "100.00"}, headers=headers).json()["id"]
+    client.delete(f"/payment/{dropped_payment}", headers=headers)
+
+    client.post(f"/savings/{leaver}", json={"amount": 1000}, headers=headers)
+    other_loan = client.post(f"/loan/{leaver}", json={"amount": "500.00", "monthly_payment": "100.00"}, headers=headers).json()["id"]
+    client.post(f"/payment/{other_loan}", json={"amount": "50.00"}, headers=headers)
+    client.delete(f"/loan/{other_loan}", headers=headers)
+
+    maintained = client.get("/admin/dashboard-stats", headers=headers).json()
+
+    # Throw the running totals away and let the dashboard aggregate from scratch
+    session.delete(session.get(CooperativeStats, 1))
+    session.commit()
+    cache.clear()
+    rebuilt = client.get("/admin/dashboard-stats", headers=headers).json()
+
+    assert maintained == rebuilt
+    assert rebuilt["total_members"] == 2
+    assert Decimal(rebuilt["total_savings"]) == Decimal("7000.00")
+    assert rebuilt["total_loans_issued_count"] == 1
@@ -0,0 +1,30 @@
+# tests/test_database.py
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from db.database import engine_options
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("url", ["sqlite://", "sqlite:///:memory:"])
+def test_database_module_imports_with_in_memory_sqlite(url):
+    # A fresh interpreter, so the module-level engine is built from `url`
+    result = subprocess.run(
+        [sys.executable, "-c", "from db.database import engine; engine.connect().close()"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "DATABASE_URL": url},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_file_databases_get_a_sized_pool():
+    assert engine_options("sqlite:///./coop.db")["pool_size"] == 20
+    assert engine_options("postgresql://coop@db/coop")["pool_pre_ping"] is True
+    assert "connect_args" not in engine_options("postgresql://coop@db/coop")
@@ -1,7 +1,8 @@
 # tests/test_loans.py
-from datetime import timedelta
+from datetime import date, timedelta
+from decimal import Decimal
 from sqlmodel import select
-from models.models import Loan
+from models.models import Loan, Payments, add_months
 
 def test_loan_crud_lifecycle(client, admin_token):
     """Tests the full Create, Read (implied), Update, and Delete cycle for a Loan."""
@@ -23,8 +24,9 @@ def test_loan_crud_lifecycle(client, admin_token):
         headers=headers,
     )
     assert loan_res.status_code == 201
-    loan_id = loan_res.json()["id"]
-    assert float(loan_res.json()["amount"]) == 1000.00
+    loan = loan_res.json()
+    loan_id = loan["id"]
+    assert Decimal(loan["amount"]) == Decimal("1000.00")
 
     # 3. UPDATE (PATCH) - Let's increase the monthly payment
     update_res = client.patch(
@@ -33,12 +35,12 @@ def test_loan_crud_lifecycle(client, admin_token):
         headers=headers,
     )
     assert update_res.status_code == 200
-    assert float(update_res.json()["monthly_payment"]) == 200.00
+    assert Decimal(update_res.json()["monthly_payment"]) == Decimal("200.00")
 
     # 4. DELETE (DELETE)
     delete_res = client.delete(f"/loan/{loan_id}", headers=headers)
     assert delete_res.status_code == 200
-    assert float(delete_res.json()["amount"]) == 1000.00
+    assert Decimal(delete_res.json()["amount"]) == Decimal("1000.00")
 
     # Verify it is actually gone from the member's profile
     member_check = client.get(f"/member/{member_id}", headers=headers)
@@ -88,7 +90,109 @@ def test_accumulated_late_fees_calculation(client, admin_token, session):
     # - The first payment was due 30 days ago (1 month late).
     # - The second payment is due in about 5 days (but hasn't crossed the threshold yet).
     # - Expectation: 1 month late * 3% * 1000 monthly payment = 30 RWF late fee.
-    late_fees = float(active_loans[0]["accumulated_late_fees"])
+    late_fees = Decimal(active_loans[0]["accumulated_late_fees"])
     
     assert late_fees > 0, "Late fees did not trigger!"
-    assert late_fees == 60.00, f"Expected 60.00, but got {late_fees}"
\ No newline at end of file
+    assert late_fees == Decimal("60.00"), f"Expected 60.00, but got {late_fees}"
+
+def test_second_active_loan_is_rejected(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    member_res = client.post(
+        "/member/",
+        json={"first_name": "Double", "last_name": "Dipper", "date_of_birth": "1990-01-01", "gender": "Male", "phone_number": "0787777777"},
+        headers=headers,
+    )
+    member_id = member_res.json()["id"]
+    client.post(f"/savings/{member_id}", json={"amount": 5000}, headers=headers)
+
+    first_loan = client.post(
+        f"/loan/{member_id}",
+        json={"amount": "1000.00", "monthly_payment": "100.00"},
+        headers=headers,
+    )
+    assert first_loan.status_code == 201
+
+    second_loan = client.post(
+        f"/loan/{member_id}",
+        json={"amount": "500.00", "monthly_payment": "100.00"},
+        headers=headers,
+    )
+    assert second_loan.status_code == 400
+    assert "active debt" in second_loan.json()["detail"]
+
+
+def test_delete_loan_with_payments(client, admin_token, session):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    member_id = client.post(
+        "/member/",
+        json={"first_name": "Paying", "last_name": "Back", "date_of_birth": "1990-01-01", "gender": "Male", "phone_number": "0788800001"},
+        headers=headers,
+    ).json()["id"]
+    client.post(f"/savings/{member_id}", json={"amount": 5000}, headers=headers)
+    loan_id = client.post(
+        f"/loan/{member_id}",
+        json={"amount": "1000.00", "monthly_payment": "100.00"},
+        headers=headers,
+    ).json()["id"]
+
+    # Two payments of 100: 15.00 then 13.72 interest, the rest is principal
+    client.post(f"/payment/{loan_id}", json={"amount": "100.00"}, headers=headers)
+    client.post(f"/payment/{loan_id}", json={"amount": "100.00"}, headers=headers)
+
+    delete_res = client.delete(f"/loan/{loan_id}", headers=headers)
+    assert delete_res.status_code == 200
+    data = delete_res.json()
+    assert data["member"] == "Paying Back"
+    assert data["payment_times"] == 2
+    assert Decimal(data["remaining_amount"]) == Decimal("1000.00") - Decimal("85.00") - Decimal("86.28")
+
+    # The payments went with the loan
+    assert session.exec(select(Payments).where(Payments.loan_id == loan_id)).first() is None
+
+
+def test_loan_update_figures_match_profile(client, admin_token):
+    """The loan response (built from SQL sums) agrees with the member profile."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    member_res = client.post(
+        "/member/",
+        json={"first_name": "Sum", "last_name": "Checker", "date_of_birth": "1990-01-01", "gender": "Female", "phone_number": "0786666661"},
+        headers=headers,
+    )
+    member_id = member_res.json()["id"]
+    client.post(f"/savings/{member_id}", json={"amount": 5000}, headers=headers)
+
+    loan_res = client.post(
+        f"/loan/{member_id}",
+        json={"amount": "1000.00", "monthly_payment": "100.00"},
+        headers=headers,
+    )
+    assert loan_res.status_code == 201
+    loan = loan_res.json()
+    assert Decimal(loan["remaining_balance"]) == Decimal("1000.00")
+    loan_id = loan["id"]
+
+    # 15.00 interest + 185.00 principal
+    client.post(f"/payment/{loan_id}", json={"amount": "200.00"}, headers=headers)
+
+    update_res = client.patch(
+        f"/loan/{loan_id}",
+        json={"amount": "1000.00", "monthly_payment": "200.00"},
+        headers=headers,
+    )
+    assert update_res.status_code == 200
+    updated_loan = update_res.json()
+    assert Decimal(updated_loan["remaining_balance"]) == Decimal("815.00")
+
+    profile_loan = client.get(f"/member/{member_id}", headers=headers).json()["active_loans"][0]
+    for field in ("remaining_balance", "current_interest_due", "accumulated_late_fees", "next_due_date"):
+        assert updated_loan[field] == profile_loan[field]
+
+
+def test_add_months_clamps_to_month_end():
+    assert add_months(date(2024, 1, 31), 1) == date(2024, 2, 29)
+    assert add_months(date(2023, 1, 31), 1) == date(2023, 2, 28)
+    assert add_months(date(2024, 8, 31), 1) == date(2024, 9, 30)
+    assert add_months(date(2024, 11, 15), 14) == date(2026, 1, 15)
@@ -1,3 +1,12 @@
+from decimal import Decimal
+
+from sqlmodel import select
+
+from dependancies.auth import create_access_token
+from models.models import Loan, Payments
+from models.users import User
+
+
 def test_delete_member_with_savings_fails(client, admin_token):
     headers = {"Authorization": f"Bearer {admin_token}"}
 
@@ -90,4 +99,276 @@ def test_delete_clean_member_succeeds(client, admin_token):
 
     # 4. Verify they are actually gone
     get_response = client.get(f"/member/{member_id}", headers=headers)
-    assert get_response.status_code == 404
\ No newline at end of file
+    assert get_response.status_code == 404
+
+def test_register_member_duplicate_phone_fails(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    member_data = {
+        "first_name": "Twin",
+        "last_name": "One",
+        "date_of_birth": "1990-01-01",
+        "gender": "Male",
+        "phone_number": "0784444000",
+    }
+
+    first_response = client.post("/member/", json=member_data, headers=headers)
+    assert first_response.status_code == 201
+
+    duplicate_response = client.post("/member/", json=member_data, headers=headers)
+    assert duplicate_response.status_code == 400
+    assert "phone number" in duplicate_response.json()["detail"].lower()
+
+
+def test_delete_member_with_paid_loan_succeeds(client, admin_token, session):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    # 1. A member who borrowed, repaid everything and withdrew their savings
+    member_response = client.post(
+        "/member/",
+        json={
+            "first_name": "Settled",
+            "last_name": "Account",
+            "date_of_birth": "1985-03-03",
+            "gender": "Female",
+            "phone_number": "0788888888",
+        },
+        headers=headers,
+    )
+    member_id = member_response.json()["id"]
+    savings_id = client.post(
+        f"/savings/{member_id}", json={"amount": 1000}, headers=headers
+    ).json()["id"]
+    loan_id = client.post(
+        f"/loan/{member_id}",
+        json={"amount": "100.00", "monthly_payment": "50.00"},
+        headers=headers,
+    ).json()["id"]
+    client.post(f"/payment/{loan_id}", json={"amount": "101.50"}, headers=headers)
+    client.delete(f"/savings/{savings_id}", headers=headers)
+
+    # 2. Deleting them also removes the closed loan and its payments
+    delete_response = client.delete(f"/member/{member_id}", headers=headers)
+    assert delete_response.status_code == 200
+    assert delete_response.json() == {"first_name": "Settled", "last_name": "Account"}
+
+    assert client.get(f"/member/{member_id}", headers=headers).status_code == 404
+    assert session.get(Loan, loan_id) is None
+    assert session.exec(select(Payments).where(Payments.loan_id == loan_id)).first() is None
+
+
+def test_member_detail_totals(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    member_id = client.post(
+        "/member/",
+        json={
+            "first_name": "Profile",
+            "last_name": "View",
+            "date_of_birth": "1990-01-01",
+            "gender": "Female",
+            "phone_number": "0789000021",
+        },
+        headers=headers,
+    ).json()["id"]
+
+    client.post(f"/savings/{member_id}", json={"amount": 1500}, headers=headers)
+    client.post(f"/savings/{member_id}", json={"amount": 2500}, headers=headers)
+    loan_id = client.post(
+        f"/loan/{member_id}",
+        json={"amount": "1000.00", "monthly_payment": "100.00"},
+        headers=headers,
+    ).json()["id"]
+    # 15.00 interest first, the other 85.00 goes to the principal
+    client.post(f"/payment/{loan_id}", json={"amount": "100.00"}, headers=headers)
+
+    response = client.get(f"/member/{member_id}", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+
+    assert Decimal(data["total_savings"]) == Decimal("4000.00")
+    assert data["completed_loans"] == []
+    [active_loan] = data["active_loans"]
+    assert len(active_loan["payments"]) == 1
+    assert Decimal(active_loan["remaining_balance"]) == Decimal("915.00")
+
+def test_member_detail_query_count_does_not_grow(client, admin_token, session, count_queries):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    def new_member(phone_number):
+        member_id = client.post(
+            "/member/",
+            json={
+                "first_name": "Query",
+                "last_name": "Count",
+                "date_of_birth": "1990-01-01",
+                "gender": "Male",
+                "phone_number": phone_number,
+            },
+            headers=headers,
+        ).json()["id"]
+        client.post(f"/savings/{member_id}", json={"amount": 1000}, headers=headers)
+        return member_id
+
+    def new_loan(member_id):
+        return client.post(
+            f"/loan/{member_id}",
+            json={"amount": "200.00", "monthly_payment": "50.00"},
+            headers=headers,
+        ).json()["id"]
+
+    def profile_queries(member_id):
+        session.expunge_all()
+        with count_queries() as statements:
+            assert client.get(f"/member/{member_id}", headers=headers).status_code == 200
+        return len(statements)
+
+    # One loan paid off at once, plus an active one with a single payment
+    newcomer = new_member("0789000031")
+    client.post(f"/payment/{new_loan(newcomer)}", json={"amount": "203.00"}, headers=headers)
+    client.post(f"/payment/{new_loan(newcomer)}", json={"amount": "50.00"}, headers=headers)
+
+    # Two loans paid off in installments, plus an active one with payments
+    veteran = new_member("0789000032")
+    for _ in range(2):
+        loan_id = new_loan(veteran)
+        for amount in ["50.00", "155.30"]:  # 47.00 principal, then 153.00 + 2.30 interest
+            client.post(f"/payment/{loan_id}", json={"amount": amount}, headers=headers)
+    loan_id = new_loan(veteran)
+    for amount in ["50.00", "50.00"]:
+        client.post(f"/payment/{loan_id}", json={"amount": amount}, headers=headers)
+
+    assert len(client.get(f"/member/{veteran}", headers=headers).json()["completed_loans"]) == 2
+    assert profile_queries(veteran) == profile_queries(newcomer)
+
+def test_search_members(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    for first_name, last_name, phone_number in [
+        ("Alice", "Mukamana", "0789000001"),
+        ("Jean", "Habimana", "0789000002"),
+    ]:
+        client.post(
+            "/member/",
+            json={
+                "first_name": first_name,
+                "last_name": last_name,
+                "date_of_birth": "1990-01-01",
+                "gender": "Female",
+                "phone_number": phone_number,
+            },
+            headers=headers,
+        )
+
+    def search(q):
+        response = client.get("/member/search", params={"q": q}, headers=headers)
+        assert response.status_code == 200
+        return sorted(m["first_name"] for m in response.json())
+
+    # Names match case-insensitively, phone numbers by any fragment
+    assert search("mukam") == ["Alice"]
+    assert search("0789000002") == ["Jean"]
+    assert search("imana") == ["Jean"]
+    assert search("alice muk") == ["Alice"]
+
+    # LIKE wildcards in the query are matched literally
+    assert search("%%") == []
+    assert search("__") == []
+
+
+def test_search_ranks_prefix_matches_first(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    for first_name, last_name, phone_number in [
+        ("Natalie", "Uwase", "0789000011"),
+        ("Alice", "Mukamana", "0789000012"),
+        ("Jean", "Habimana", "0789000013"),
+    ]:
+        client.post(
+            "/member/",
+            json={
+                "first_name": first_name,
+                "last_name": last_name,
+                "date_of_birth": "1990-01-01",
+                "gender": "Female",
+                "phone_number": phone_number,
+            },
+            headers=headers,
+        )
+
+    def search(q):
+        response = client.get("/member/search", params={"q": q}, headers=headers)
+        return [m["first_name"] for m in response.json()]
+
+    # "Alice" starts with the query, "Natalie" only contains it
+    assert search("ali") == ["Alice", "Natalie"]
+    # Equal rank falls back to alphabetical order by last name
+    assert search("mana") == ["Jean", "Alice"]
+
+def test_admin_routes_reject_non_admins(client, session):
+    member = User(
+        email="member@test.com",
+        hashed_password="hashed_secret",
+        is_active=True,
+        is_admin=False,
+    )
+    session.add(member)
+    session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(user_id=member.id)}"}  # type:ignore
+
+    # Routes that never mention the admin in their own signature are guarded too
+    assert client.post("/loan/1", json={"amount": "10", "monthly_payment": "5"}, headers=headers).status_code == 403
+    assert client.post("/payment/1", json={"amount": "10"}, headers=headers).status_code == 403
+    assert client.get("/admin/dashboard-stats", headers=headers).status_code == 403
+
+
+def test_logged_out_token_is_rejected(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    assert client.get("/member/", headers=headers).status_code == 200
+
+    logout = client.post("/auth/logout", json={"token": "refresh-token"}, headers=headers)
+    assert logout.status_code == 200
+
+    assert client.get("/member/", headers=headers).status_code == 401
+
+def test_list_members_pagination(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    for index in range(3):
+        client.post(
+            "/member/",
+            json={
+                "first_name": f"Listed{index}",
+                "last_name": "Member",
+                "date_of_birth": "1990-01-01",
+                "gender": "Male",
+                "phone_number": f"078900010{index}",
+            },
+            headers=headers,
+        )
+
+    # 1. First page, with the total requested
+    first_page = client.get("/member/", params={"limit": 2, "with_count": True}, headers=headers).json()
+    assert first_page["total_count"] == 3
+    assert [m["first_name"] for m in first_page["members"]] == ["Listed2", "Listed1"]
+    assert first_page["next_cursor"] is not None
+
+    # 2. Follow the cursor; the total is skipped unless asked for
+    second_page = client.get("/member/", params={"limit": 2, **first_page["next_cursor"]}, headers=headers).json()
+    assert second_page["total_count"] is None
+    assert [m["first_name"] for m in second_page["members"]] == ["Listed0"]
+    assert second_page["next_cursor"] is None
+
+    # 3. Offset paging still works
+    by_offset = client.get("/member/", params={"offset": 2, "limit": 2}, headers=headers).json()
+    assert [m["first_name"] for m in by_offset["members"]] == ["Listed0"]
+
+
+def test_timestamps_within_a_request_share_one_clock_reading(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.post(
+        "/member/",
+        json={"first_name": "Same", "last_name": "Instant", "date_of_birth": "1990-01-01", "gender": "Female", "phone_number": "0785555551"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    member = response.json()
+    assert member["created_at"] == member["updated_at"]
@@ -1,215 +1,131 @@
 # test_payments.py
+from decimal import Decimal
 
-def test_full_loan_lifecycle(client, admin_token):
+import pytest
+from fastapi import HTTPException
+
+from api.services import register_payment, update_payment
+from models.models import CreatePayments, PaymentUpdate, Payments, calculate_interest_due_cents, split_payment_cents
+
+
+# Loan shapes shared by the create and update cases
+LARGE_LOAN = {"amount": "1000.00", "monthly_payment": "100.00", "savings": 500}
+MEDIUM_LOAN = {"amount": "500.00", "monthly_payment": "100.00", "savings": 1000}
+# Max allowed loan is 200.00 when savings is 100; 200 + 3.00 interest clears it
+SMALL_LOAN = {"amount": "200.00", "monthly_payment": "50.00", "savings": 100}
+
+
+def test_create_payment(client, admin_token, open_loan):
     headers = {"Authorization": f"Bearer {admin_token}"}
+    loan_id = open_loan(**LARGE_LOAN)["id"]
 
-    # --- STEP 1: REGISTER MEMBER ---
-    member_data = {
-        "first_name": "John",
-        "last_name": "Doe",
-        "date_of_birth": "1990-01-01",
-        "gender": "Male",
-        "phone_number": "+123456789",
-    }
-    response = client.post("/member/", json=member_data, headers=headers)
-    assert response.status_code == 201, f"Failed to create member: {response.text}"
-    member_id = response.json()["id"]
-    
-    # --- STEP 2: ADD SAVINGS ---
-    savings_data = {
-        "amount": 500,
-    }
-    # FIXED: Added the 'f' prefix to the route string
-    response = client.post(f"/savings/{member_id}", json=savings_data, headers=headers)
-    assert response.status_code == 201, f"Failed to create savings: {response.text}"
-    
-    # --- STEP 3: ISSUE LOAN ---
-    loan_data = {
-        "amount": "1000.00",
-        "interest_rate": 1.5,  # Added to satisfy the backend schema requirements
-        "monthly_payment": "100.00",
-    }
-    response = client.post(f"/loan/{member_id}", json=loan_data, headers=headers)
-    assert response.status_code == 201, f"Failed to create loan: {response.text}"
-    loan_id = response.json()["id"]
-
-    # --- STEP 4: MAKE A PAYMENT ---
-    payment_data = {"amount": "100.00"}
-    response = client.post(f"/payment/{loan_id}", json=payment_data, headers=headers)
-
-    assert response.status_code == 201, f"Failed to create payment: {response.text}"
-    data = response.json()
+    response = client.post(f"/payment/{loan_id}", json={"amount": "100.00"}, headers=headers)
 
-    # Verify the waterfall calculation worked! (1.5% of 1000 = 15)
+    assert response.status_code == 201, response.text
+    data = response.json()
+    # The waterfall takes interest first: 1.5% of 1000 = 15
     assert data["interest_amount"] == "15.00"
     assert data["principal_amount"] == "85.00"
     assert data["total_amount"] == "100.00"
 
 
-def test_loan_overpayment_protection(client, admin_token):
+def test_create_overpayment_is_rejected(client, admin_token, open_loan):
     headers = {"Authorization": f"Bearer {admin_token}"}
+    loan_id = open_loan(**SMALL_LOAN)["id"]
 
-    # 1. Create Member
-    response = client.post(
-        "/member/",
-        json={
-            "first_name": "Jane",
-            "last_name": "Doe",
-            "date_of_birth": "1990-01-01",
-            "gender": "Female",
-            "phone_number": "987654321",
-        },
-        headers=headers,
-    )
-    assert response.status_code == 201, f"Failed to create member: {response.text}"
-    member_id = response.json()["id"]   
-    
-    # 2. Create Savings
-    savings_data = {
-        "amount": 100
-    }
-    # FIXED: Added the 'f' prefix to the route string
-    response = client.post(f"/savings/{member_id}", json=savings_data, headers=headers)
-    assert response.status_code == 201, f"Failed to create savings: {response.text}"
-
-    # 3. Create Loan (Max allowed is 200.00 because savings is 100)
-    response = client.post(
-        f"/loan/{member_id}",
-        json={
-            "amount": "200.00",
-            "interest_rate": 1.5, # Added to satisfy schema
-            "monthly_payment": "50.00",
-        },
-        headers=headers,
-    )
-    assert response.status_code == 201, f"Failed to create loan: {response.text}"
-    loan_id = response.json()["id"]
-
-    # 4. Try to pay 300.00 (Should fail because 200 loan + 3 interest = 203 to clear)
-    response = client.post(
-        f"/payment/{loan_id}", json={"amount": "300.00"}, headers=headers
-    )
-
-    # 5. Verify the backend successfully blocked the overpayment
-    assert response.status_code == 422
+    # 300.00 is more than the 203.00 needed to clear the loan
+    response = client.post(f"/payment/{loan_id}", json={"amount": "300.00"}, headers=headers)
+
+    assert response.status_code == 422, response.text
     assert "Overpayment" in response.json()["detail"]
-    
-# Add this to the bottom of test_payments.py
 
-def test_update_payment_recalculates_correctly(client, admin_token):
+
+def test_update_payment(client, admin_token, open_loan):
     headers = {"Authorization": f"Bearer {admin_token}"}
+    loan_id = open_loan(**MEDIUM_LOAN)["id"]
 
-    # 1. Create a Member
-    member_response = client.post(
-        "/member/",
-        json={
-            "first_name": "Update",
-            "last_name": "Test",
-            "date_of_birth": "1985-05-05",
-            "gender": "Female",
-            "phone_number": "0785555555",
-        },
-        headers=headers,
-    )
-    member_id = member_response.json()["id"]
-
-    # 2. Add Savings
-    client.post(f"/savings/{member_id}", json={"amount": 1000}, headers=headers)
-
-    # 3. Issue a Loan
-    loan_response = client.post(
-        f"/loan/{member_id}",
-        json={
-            "amount": "500.00",
-            "interest_rate": 1.5,
-            "monthly_payment": "100.00",
-        },
-        headers=headers,
-    )
-    loan_id = loan_response.json()["id"]
-
-    # 4. Make an Initial Payment of 50.00 RWF
-    initial_payment = client.post(
-        f"/payment/{loan_id}", 
-        json={"amount": "50.00"}, 
-        headers=headers
-    )
+    # An initial valid payment of 50.00 RWF, then change its amount
+    initial_payment = client.post(f"/payment/{loan_id}", json={"amount": "50.00"}, headers=headers)
     assert initial_payment.status_code == 201
     payment_id = initial_payment.json()["id"]
 
-    # 5. UPDATE the payment to 100.00 RWF
-    update_response = client.patch(
-        f"/payment/{payment_id}", 
-        json={"amount": "100.00"}, 
-        headers=headers
-    )
-    
-    # 6. Verify the update succeeded
-    assert update_response.status_code == 200, f"Update failed: {update_response.text}"
-    updated_data = update_response.json()
-    
-    # Ensure the new total amount is registered
-    assert float(updated_data["total_amount"]) == 100.00
-    
-    # The interest on a 500 loan at 1.5% is 7.5
-    # If the payment is 100, principal should be 92.5
-    assert float(updated_data["interest_amount"]) == 7.50
-    assert float(updated_data["principal_amount"]) == 92.50
-    
-
-def test_update_payment_overpayment_protection(client, admin_token):
+    response = client.patch(f"/payment/{payment_id}", json={"amount": "100.00"}, headers=headers)
+
+    assert response.status_code == 200, response.text
+    data = response.json()
+    # The interest on a 500 loan at 1.5% is 7.50, so 100 leaves 92.50 of principal
+    assert data["interest_amount"] == "7.50"
+    assert data["principal_amount"] == "92.50"
+    assert data["total_amount"] == "100.00"
+
+
+def test_update_overpayment_is_rejected(session, admin, open_loan):
+    # Calls the handlers directly: only the overpayment branch is under test
+    loan_id = open_loan(**SMALL_LOAN)["id"]
+    payment = register_payment(loan_id, CreatePayments.model_validate({"amount": "50.00"}), session=session)
+
+    # 300.00 exceeds the ~203 total clearance
+    with pytest.raises(HTTPException) as rejected:
+        update_payment(payment.id, PaymentUpdate.model_validate({"amount": "300.00"}), session=session, admin=admin)  # type:ignore
+
+    assert rejected.value.status_code == 400
+    assert "Overpayment" in rejected.value.detail
+    assert session.get(Payments, payment.id).total_amount == Decimal("50.00")  # type:ignore
+
+
+def test_full_payoff_closes_loan(client, admin_token, open_loan):
     headers = {"Authorization": f"Bearer {admin_token}"}
 
-    # 1. Create a Member
-    member_response = client.post(
-        "/member/",
-        json={
-            "first_name": "Update",
-            "last_name": "Overpayer",
-            "date_of_birth": "1990-01-01",
-            "gender": "Male",
-            "phone_number": "0784444444",
-        },
-        headers=headers,
-    )
-    assert member_response.status_code == 201
-    member_id = member_response.json()["id"]
-
-    # 2. Add Savings
-    client.post(f"/savings/{member_id}", json={"amount": 1000}, headers=headers)
-
-    # 3. Issue a Loan (Amount: 200, Interest: 1.5% -> 3)
-    loan_response = client.post(
-        f"/loan/{member_id}",
-        json={
-            "amount": "200.00",
-            "interest_rate": 1.5,
-            "monthly_payment": "50.00",
-        },
-        headers=headers,
-    )
-    assert loan_response.status_code == 201
-    loan_id = loan_response.json()["id"]
-
-    # 4. Make an Initial Valid Payment of 50.00 RWF
-    initial_payment = client.post(
-        f"/payment/{loan_id}", 
-        json={"amount": "50.00"}, 
-        headers=headers
-    )
-    assert initial_payment.status_code == 201
-    payment_id = initial_payment.json()["id"]
+    loan = open_loan(amount="200.00", monthly_payment="50.00", savings=1000)
+    loan_id, member_id = loan["id"], loan["member_id"]
+
+    # 200 principal + 3.00 interest (1.5% of 200) clears the loan in one go
+    payoff = client.post(f"/payment/{loan_id}", json={"amount": "203.00"}, headers=headers)
+    assert payoff.status_code == 201, f"Payoff failed: {payoff.text}"
+    assert payoff.json()["principal_amount"] == "200.00"
+
+    profile = client.get(f"/member/{member_id}", headers=headers).json()
+    assert len(profile["active_loans"]) == 0
+    assert len(profile["completed_loans"]) == 1
+
+    # Nothing more can be paid on a closed loan
+    extra = client.post(f"/payment/{loan_id}", json={"amount": "1.00"}, headers=headers)
+    assert extra.status_code == 400
+
+    # An unknown loan is a 404, not an "already paid" 400
+    missing = client.post("/payment/999999", json={"amount": "1.00"}, headers=headers)
+    assert missing.status_code == 404
+
+
+def test_update_payment_that_would_reopen_a_loan_changes_nothing(client, admin_token, open_loan):
+    headers = {"Authorization": f"Bearer {admin_token}"}
 
-    # 5. Try to UPDATE the payment to 300.00 RWF (Exceeds the ~203 total clearance)
-    update_response = client.patch(
-        f"/payment/{payment_id}", 
-        json={"amount": "300.00"}, 
-        headers=headers
-    )
-    
-    # 6. Verify the backend correctly identifies and blocks the overpayment
-    assert update_response.status_code in [400, 422], f"Expected failure, got {update_response.status_code}"
-    
-    # Check that the error message explicitly mentions the overpayment
-    error_detail = update_response.json().get("detail", "").lower()
-    assert "overpayment" in error_detail or "exceeds" in error_detail
\ No newline at end of file
+    # Pay the first loan off, then take a second one
+    first_loan = open_loan(amount="200.00", monthly_payment="50.00", savings=1000)
+    member_id = first_loan["member_id"]
+    payoff_id = client.post(f"/payment/{first_loan['id']}", json={"amount": "203.00"}, headers=headers).json()["id"]
+    client.post(f"/loan/{member_id}", json={"amount": "100.00", "monthly_payment": "50.00"}, headers=headers)
+
+    # Shrinking the payoff would reopen the first loan next to the active one
+    response = client.patch(f"/payment/{payoff_id}", json={"amount": "100.00"}, headers=headers)
+    assert response.status_code == 400
+
+    profile = client.get(f"/member/{member_id}", headers=headers).json()
+    [completed] = profile["completed_loans"]
+    assert completed["payments"][0]["principal_amount"] == "200.00"
+
+
+@pytest.mark.parametrize(
+    "cash, late_fees_due, interest_due, expected",
+    [
+        # 1.5% of 1000.00 is 15.00 of interest, the rest is principal
+        (10000, 0, calculate_interest_due_cents(100000), (0, 1500, 8500)),
+        (10000, 0, calculate_interest_due_cents(50000), (0, 750, 9250)),
+        # Late fees are cleared before interest, interest before principal
+        (2000, 600, 1500, (600, 1400, 0)),
+        (500, 600, 1500, (500, 0, 0)),
+        (0, 600, 1500, (0, 0, 0)),
+    ],
+)
+def test_payment_waterfall(cash, late_fees_due, interest_due, expected):
+    assert split_payment_cents(cash, late_fees_due, interest_due) == expected
@@ -0,0 +1,85 @@
+# tests/test_savings.py
+
+
+def test_savings_keyset_pagination(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    member_response = client.post(
+        "/member/",
+        json={
+            "first_name": "Page",
+            "last_name": "Through",
+            "date_of_birth": "1990-01-01",
+            "gender": "Male",
+            "phone_number": "0787777777",
+        },
+        headers=headers,
+    )
+    member_id = member_response.json()["id"]
+    for amount in (100, 200, 300, 400, 500):
+        client.post(f"/savings/{member_id}", json={"amount": amount}, headers=headers)
+
+    # 1. First page: the newest records
+    first_page = client.get(f"/savings/{member_id}?limit=2", headers=headers)
+    assert first_page.status_code == 200
+    first_records = first_page.json()
+    assert [float(s["amount"]) for s in first_records] == [500, 400]
+
+    # 2. Resume after the last record of the first page
+    last = first_records[-1]
+    second_page = client.get(
+        f"/savings/{member_id}",
+        params={"limit": 2, "after_ts": last["updated_at"], "after_id": last["id"]},
+        headers=headers,
+    )
+    assert second_page.status_code == 200
+    assert [float(s["amount"]) for s in second_page.json()] == [300, 200]
+
+    # 3. A cursor needs both halves
+    partial = client.get(
+        f"/savings/{member_id}", params={"after_id": last["id"]}, headers=headers
+    )
+    assert partial.status_code == 422
+
+    # 4. Page sizes outside 1..100 are rejected instead of returning everything
+    for limit in (0, -1, 101):
+        response = client.get(f"/savings/{member_id}", params={"limit": limit}, headers=headers)
+        assert response.status_code == 422
+
+
+def test_member_savings_total_follows_every_savings_write(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    member = client.post(
+        "/member/",
+        json={
+            "first_name": "Running",
+            "last_name": "Total",
+            "date_of_birth": "1990-01-01",
+            "gender": "Female",
+            "phone_number": "0787777771",
+        },
+        headers=headers,
+    ).json()
+    member_id = member["id"]
+
+    def profile():
+        return client.get(f"/member/{member_id}", headers=headers).json()
+
+    first = client.post(f"/savings/{member_id}", json={"amount": 1000}, headers=headers).json()
+    second = client.post(f"/savings/{member_id}", json={"amount": 500}, headers=headers).json()
+    assert float(profile()["total_savings"]) == 1500
+
+    client.patch(f"/savings/{first['id']}", json={"amount": 700}, headers=headers)
+    assert float(profile()["total_savings"]) == 1200
+
+    client.delete(f"/savings/{second['id']}", headers=headers)
+    assert float(profile()["total_savings"]) == 700
+
+    # A null amount is rejected and leaves the total alone
+    cleared = client.patch(f"/savings/{first['id']}", json={"amount": None}, headers=headers)
+    assert cleared.status_code == 400
+    assert float(profile()["total_savings"]) == 700
+
+    # Deposits are not edits of the member itself
+    assert profile()["updated_at"] == member["updated_at"]
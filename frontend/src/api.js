@@ -99,12 +99,16 @@ export const api = {
   },
   getCurrentUser: () => fetchWithAuth('/auth/me'),
   searchMembers: (query) => fetchWithAuth(`/member/search?q=${encodeURIComponent(query)}`),
-  getMembers: (offset = 0, limit = 20) => fetchWithAuth(`/member/?offset=${offset}&limit=${limit}`),
+  // total_count is only computed (a full COUNT) when withCount is set
+  getMembers: (offset = 0, limit = 20, withCount = false) => fetchWithAuth(`/member/?offset=${offset}&limit=${limit}&with_count=${withCount}`),
   getMemberDetails: (memberId) => fetchWithAuth(`/member/${memberId}`),
   createMember: (memberData) => fetchWithAuth('/member/', { method: 'POST', body: JSON.stringify(memberData) }),
   updateMember: (memberId, updateData) => fetchWithAuth(`/member/${memberId}`, { method: 'PATCH', body: JSON.stringify(updateData) }), // Fixed
   deleteMember: (memberId) => fetchWithAuth(`/member/${memberId}`, { method: 'DELETE' }), // Fixed
-  getMemberSavings: (memberId, skip = 0, limit = 10) => fetchWithAuth(`/savings/${memberId}?skip=${skip}&limit=${limit}`),
+  // Pass the last record of the previous page as `after` to fetch the next one
+  getMemberSavings: (memberId, limit = 10, after = null) => fetchWithAuth(
+    `/savings/${memberId}?limit=${limit}` + (after ? `&after_ts=${encodeURIComponent(after.updated_at)}&after_id=${after.id}` : '')
+  ),
   createSavings: (memberId, savingsData) => fetchWithAuth(`/savings/${memberId}`, { method: 'POST', body: JSON.stringify(savingsData) }),
   updateSavings: (savingsId, updateData) => fetchWithAuth(`/savings/${savingsId}`, { method: 'PATCH', body: JSON.stringify(updateData) }), // Fixed
   deleteSavings: (savingsId) => fetchWithAuth(`/savings/${savingsId}`, { method: 'DELETE' }), // Fixed
@@ -37,7 +37,7 @@ export default function MemberProfile() {
     try {
       const [memberData, savingsData] = await Promise.all([
         api.getMemberDetails(memberId),
-        api.getMemberSavings(memberId, 0, 50)
+        api.getMemberSavings(memberId, 50)
       ]);
       setMember(memberData); setSavingsHistory(savingsData || []);
     } catch (err) { setError(err.message); } 
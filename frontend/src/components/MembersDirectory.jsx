@@ -16,12 +16,13 @@ export default function MembersDirectory() {
 
   useEffect(() => { loadMembers(); }, [offset]);
 
-  const loadMembers = async () => {
+  // The total only changes when members are added, so count on the first page and after adds
+  const loadMembers = async (withCount = offset === 0) => {
     setLoading(true);
     try {
-      const data = await api.getMembers(offset, limit);
+      const data = await api.getMembers(offset, limit, withCount);
       setMembers(data.members);
-      setTotalCount(data.total_count);
+      if (data.total_count !== null) setTotalCount(data.total_count);
     } catch (error) {
       console.error('Failed to load members:', error);
     } finally {
@@ -30,7 +31,7 @@ export default function MembersDirectory() {
   };
 
   const handleMemberAdded = () => {
-    loadMembers();
+    loadMembers(true);
     setShowAddModal(false);
   };
 